@@ -1,23 +1,35 @@
 import asyncio
+import functools
+import heapq
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Callable, Any, Set, Tuple
 
 import omni.usd
 import omni.kit.app
 import omni.replicator.core as rep
-from pxr import UsdGeom
+from pxr import Sdf, Tf, Usd
 
 from .models import CameraSettings, CaptureStatus, CaptureMode
 from .image_writer import ImageWriter
 from .video_writer import VideoWriter
 from .usd_camera_utils import UsdCameraUtils
 
+# Schema type name of UsdGeom.Camera prims, compared directly against prim type names
+_CAMERA_TYPE_NAME = "Camera"
+_NS_PER_SECOND = 1_000_000_000
+# Number of recent frame times the app FPS is averaged over
+_FPS_WINDOW_SIZE = 60
+
 
 class CameraManager:
     """Manages cameras and image capture using omni.replicator."""
 
+    # Maximum number of capture batches waiting for an orchestrator step
+    CAPTURE_QUEUE_SIZE = 2
+
     def __init__(self, on_capture_callback: Optional[Callable[[str, str], None]] = None):
         """
         Initialize the camera manager.
@@ -27,27 +39,49 @@ class CameraManager:
         """
         self._render_products: Dict[str, Any] = {}
         self._writers: Dict[str, Any] = {}
+        self._io_executor: Optional[ThreadPoolExecutor] = None  # Encodes and saves frames for writers
         self._update_subscription = None
         self._frame_count: int = 0
         self._active_cameras: List[CameraSettings] = []
+        self._enabled_cameras: List[CameraSettings] = []  # Subset of _active_cameras that capture
         self._output_folder: str = ""
         self._on_capture_callback = on_capture_callback
+
+        # Scene camera paths, cached per stage until prims are added, removed or retyped
+        self._scene_cameras: Optional[List[str]] = None
+        self._scene_cameras_stage_id: Optional[int] = None
+        self._objects_changed_listener = None
         self._is_capturing: bool = False
+        # Each capture gets a session id that tags its writers' outputs. A session's
+        # entry (prim_path -> last file reported by its writer) is removed once its
+        # writers are finalized, and later outputs from them are ignored.
+        self._session_id: int = 0
+        self._session_paths: Dict[int, Dict[str, str]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # Loop that capture callbacks run on
 
         # Time-based FPS capture tracking
-        self._elapsed_time: Dict[str, float] = {}  # prim_path -> accumulated time
+        self._schedule: List[Tuple[int, int]] = []  # min-heap of (next capture time in ns, camera index)
+        self._capture_intervals: List[int] = []  # camera index -> nanoseconds between captures
+        self._camera_indices: Dict[str, int] = {}  # prim_path -> camera index
         self._measured_app_fps: float = 60.0  # Measured app frame rate
-        self._fps_sample_count: int = 0
-        self._fps_sample_time: float = 0.0
+        # Ring buffer of the last _FPS_WINDOW_SIZE frame times, with a running sum
+        self._dt_window: List[float] = [1.0 / 60.0] * _FPS_WINDOW_SIZE
+        self._dt_window_index: int = 0
+        self._dt_window_sum: float = 1.0 / 60.0 * _FPS_WINDOW_SIZE
+        self._fps_check_time: float = 0.0  # Seconds since FPS drops were last checked
 
-        # Prevent overlapping step_async calls which can cause frame drops
-        self._step_pending: bool = False
+        # Capture batches handed from the update callback to a single consumer task,
+        # which serializes step_async calls to prevent overlapping steps
+        self._capture_queue: Optional[asyncio.Queue] = None
+        self._consumer_task: Optional[asyncio.Future] = None
 
         # Capture statistics for actual FPS calculation
         self._capture_start_time: float = 0.0
-        self._camera_frame_counts: Dict[str, int] = {}  # prim_path -> frames captured
-        self._total_capture_time: float = 0.0  # Total elapsed capture time
-        self._fps_drop_warnings: List[str] = []  # FPS drop events during capture
+        self._frame_counts: List[int] = []  # camera index -> frames captured
+        self._total_capture_ns: int = 0  # Total elapsed capture time, integer ns to avoid drift
+        self._fps_drop_warnings: Set[str] = set()  # Distinct FPS drop events during capture
+        self._fps_warning_prefixes: Dict[str, str] = {}  # prim_path -> preformatted warning text
+        self._max_target_fps: int = 0  # Highest target FPS among enabled cameras
 
     def scan_scene_cameras(self) -> List[str]:
         """
@@ -61,12 +95,42 @@ class CameraManager:
         if not stage:
             return []
 
-        camera_prims = []
-        for prim in stage.Traverse():
-            if prim.IsA(UsdGeom.Camera):
-                camera_prims.append(str(prim.GetPath()))
+        stage_id = context.get_stage_id()
+        if stage_id != self._scene_cameras_stage_id:
+            # New stage: listen for structural changes on it instead
+            self._revoke_objects_changed_listener()
+            self._objects_changed_listener = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+            )
+            self._scene_cameras_stage_id = stage_id
+            self._scene_cameras = None
+
+        if self._scene_cameras is None:
+            self._scene_cameras = [
+                str(prim.GetPath())
+                for prim in stage.Traverse()
+                if prim.GetTypeName() == _CAMERA_TYPE_NAME
+            ]
+        return list(self._scene_cameras)
+
+    def _on_objects_changed(self, notice, stage) -> None:
+        """Invalidate the scene camera cache when prims are resynced.
+
+        Attribute-only edits (such as camera slider changes) do not resync
+        prims and keep the cache.
 
-        return camera_prims
+        Args:
+            notice: The Usd.Notice.ObjectsChanged notice.
+            stage: The stage that changed.
+        """
+        if notice.GetResyncedPaths():
+            self._scene_cameras = None
+
+    def _revoke_objects_changed_listener(self) -> None:
+        """Stop listening for stage changes."""
+        if self._objects_changed_listener is not None:
+            self._objects_changed_listener.Revoke()
+            self._objects_changed_listener = None
 
     def create_render_product(self, camera_settings: CameraSettings) -> bool:
         """
@@ -89,39 +153,85 @@ class CameraManager:
             print(f"[brian.camera_management] Error creating render product: {e}")
             return False
 
-    def _setup_writer(self, camera_settings: CameraSettings, output_folder: str) -> bool:
+    def _make_video_writer(
+        self, camera_settings: CameraSettings, camera_output: str, timestamp: str
+    ) -> VideoWriter:
+        """
+        Create a VideoWriter that encodes a timestamped MP4 in the camera's folder.
+
+        Args:
+            camera_settings: Settings for the camera.
+            camera_output: Output folder for this camera.
+            timestamp: Capture start timestamp shared by all cameras.
+
+        Returns:
+            The new writer.
+        """
+        camera_name = camera_settings.short_name
+        video_path = os.path.join(camera_output, f"{camera_name}_{timestamp}.mp4")
+        return VideoWriter(
+            video_filepath=video_path,
+            fps=camera_settings.fps,
+            width=camera_settings.width,
+            height=camera_settings.height,
+            executor=self._io_executor,
+            on_write=functools.partial(self._on_writer_output, self._session_id, camera_settings)
+        )
+
+    def _make_image_writer(
+        self, camera_settings: CameraSettings, camera_output: str, timestamp: str
+    ) -> ImageWriter:
+        """
+        Create an ImageWriter that saves a PNG sequence in the camera's folder.
+
+        Args:
+            camera_settings: Settings for the camera.
+            camera_output: Output folder for this camera.
+            timestamp: Capture start timestamp shared by all cameras.
+
+        Returns:
+            The new writer.
+        """
+        return ImageWriter(
+            output_dir=camera_output,
+            camera_name=camera_settings.short_name,
+            image_format="png",
+            capture_start_time=timestamp,
+            # _setup_writer() has just created the camera folder
+            create_output_dir=False,
+            executor=self._io_executor,
+            on_write=functools.partial(self._on_writer_output, self._session_id, camera_settings)
+        )
+
+    # Writer constructor for each capture mode, called as factory(self, settings, output_dir, timestamp)
+    _WRITER_FACTORIES: Dict[CaptureMode, Callable[..., Any]] = {
+        CaptureMode.VIDEO: _make_video_writer,
+        CaptureMode.IMAGE: _make_image_writer,
+    }
+
+    def _setup_writer(self, camera_settings: CameraSettings, output_folder: str, timestamp: str) -> bool:
         """
-        Set up writer for a camera (BasicWriter for images, VideoWriter for video).
+        Set up writer for a camera (ImageWriter for images, VideoWriter for video).
 
         Args:
             camera_settings: Settings for the camera.
             output_folder: Base output folder path.
+            timestamp: Capture start timestamp shared by all cameras.
 
         Returns:
             True if successful, False otherwise.
         """
         try:
-            camera_name = camera_settings.prim_path.split("/")[-1]
+            camera_name = camera_settings.short_name
             camera_output = os.path.join(output_folder, camera_name)
-            os.makedirs(camera_output, exist_ok=True)
-
-            if camera_settings.capture_mode == CaptureMode.VIDEO:
-                # Video mode - use custom VideoWriter
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                video_path = os.path.join(camera_output, f"{camera_name}_{timestamp}.mp4")
-                writer = VideoWriter(
-                    video_filepath=video_path,
-                    fps=camera_settings.fps,
-                    width=camera_settings.width,
-                    height=camera_settings.height
-                )
-            else:
-                # Image mode - use custom ImageWriter
-                writer = ImageWriter(
-                    output_dir=camera_output,
-                    camera_name=camera_name,
-                    image_format="png"
-                )
+            # start_capture creates the session folder, so only the leaf is missing
+            try:
+                os.mkdir(camera_output)
+            except FileExistsError:
+                pass
+
+            factory = self._WRITER_FACTORIES[camera_settings.capture_mode]
+            writer = factory(self, camera_settings, camera_output, timestamp)
 
             render_product = self._render_products.get(camera_settings.prim_path)
             self._writers[camera_settings.prim_path] = writer
@@ -149,6 +259,11 @@ class CameraManager:
             print("[brian.camera_management] Capture already in progress")
             return False
 
+        # Two consumers would overlap their orchestrator steps
+        if self._consumer_task is not None and not self._consumer_task.done():
+            print("[brian.camera_management] Previous capture is still finishing its last step")
+            return False
+
         if not output_folder:
             print("[brian.camera_management] Output folder not specified")
             return False
@@ -165,29 +280,64 @@ class CameraManager:
         self._output_folder = os.path.join(output_folder, f"capture_{timestamp}")
         os.makedirs(self._output_folder, exist_ok=True)
 
+        # Writers report files from IO threads; callbacks are marshalled back to this loop
+        self._loop = asyncio.get_event_loop()
+        self._session_id += 1
+        self._session_paths[self._session_id] = {}
+
+        # Keep image encoding and file writes off the update loop
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=min(4, len(self._active_cameras)),
+            thread_name_prefix="CameraCaptureIO"
+        )
+
+        # Apply camera optical properties to USD before creating render products,
+        # coalesced into a single change notification
+        with Sdf.ChangeBlock():
+            for cam in self._active_cameras:
+                UsdCameraUtils.apply_settings_to_usd(cam.prim_path, cam)
+
         # Set up render products and writers for ALL cameras (enabled check is in _on_update)
         for cam in self._active_cameras:
             cam.frame_counter = 0
-            self._elapsed_time[cam.prim_path] = 0.0  # Initialize time tracking
-            # Apply camera optical properties to USD before creating render product
-            UsdCameraUtils.apply_settings_to_usd(cam.prim_path, cam)
             if not self.create_render_product(cam):
                 self.stop_capture()
                 return False
-            if not self._setup_writer(cam, self._output_folder):
+            if not self._setup_writer(cam, self._output_folder, timestamp):
                 self.stop_capture()
                 return False
 
         # Reset FPS measurement and capture state
-        self._fps_sample_count = 0
-        self._fps_sample_time = 0.0
-        self._step_pending = False
+        self._dt_window = [1.0 / 60.0] * _FPS_WINDOW_SIZE
+        self._dt_window_index = 0
+        self._dt_window_sum = 1.0 / 60.0 * _FPS_WINDOW_SIZE
+        self._measured_app_fps = 60.0
+        self._fps_check_time = 0.0
 
         # Initialize capture statistics
         self._capture_start_time = time.time()
-        self._camera_frame_counts = {cam.prim_path: 0 for cam in self._active_cameras}
-        self._total_capture_time = 0.0
-        self._fps_drop_warnings = []
+        self._frame_counts = [0] * len(self._active_cameras)
+        self._total_capture_ns = 0
+        self._fps_drop_warnings = set()
+
+        # Build the capture schedule: each enabled camera is first due one interval in
+        self._capture_intervals = [_NS_PER_SECOND // cam.fps for cam in self._active_cameras]
+        self._camera_indices = {cam.prim_path: i for i, cam in enumerate(self._active_cameras)}
+        self._enabled_cameras = [cam for cam in self._active_cameras if cam.enabled]
+        self._fps_warning_prefixes = {
+            cam.prim_path: self._format_fps_warning_prefix(cam) for cam in self._enabled_cameras
+        }
+        self._max_target_fps = max((cam.fps for cam in self._enabled_cameras), default=0)
+        self._schedule = [
+            (self._capture_intervals[i], i)
+            for i, cam in enumerate(self._active_cameras)
+            if cam.enabled
+        ]
+        heapq.heapify(self._schedule)
+
+        # Start the consumer that steps the orchestrator for queued capture batches
+        self._capture_queue = asyncio.Queue(maxsize=self.CAPTURE_QUEUE_SIZE)
+        self._consumer_task = asyncio.ensure_future(self._consume_captures(self._capture_queue))
 
         # Subscribe to update events
         update_stream = omni.kit.app.get_app().get_update_event_stream()
@@ -212,132 +362,237 @@ class CameraManager:
         dt = event.payload.get("dt", 1.0 / 60.0)  # Fallback to 60fps
 
         # Track total capture time
-        self._total_capture_time += dt
-
-        # Measure app FPS (sample over 1 second)
-        self._fps_sample_count += 1
-        self._fps_sample_time += dt
-        if self._fps_sample_time >= 1.0:
-            self._measured_app_fps = self._fps_sample_count / self._fps_sample_time
-            self._fps_sample_count = 0
-            self._fps_sample_time = 0.0
+        self._total_capture_ns += round(dt * _NS_PER_SECOND)
+
+        # Measure app FPS over a sliding window of recent frames
+        window = self._dt_window
+        i = self._dt_window_index
+        self._dt_window_sum += dt - window[i]
+        window[i] = dt
+        self._dt_window_index = (i + 1) % _FPS_WINDOW_SIZE
+        self._measured_app_fps = _FPS_WINDOW_SIZE / self._dt_window_sum
+
+        self._fps_check_time += dt
+        if self._fps_check_time >= 1.0:
+            self._fps_check_time = 0.0
+            # Resum so rounding in the running sum cannot accumulate
+            self._dt_window_sum = sum(window)
 
             # Check for FPS drops and log warning (once per second max)
             self._check_fps_drops()
 
-        for camera in self._active_cameras:
-            if not camera.enabled:
+        # Due cameras stay in the heap while the queue is full and capture on a later frame
+        if self._capture_queue.full():
+            return
+
+        # Collect every camera whose deadline has been reached. Only the heap head is
+        # inspected on frames where nothing is due. Hot attributes are bound locally;
+        # nothing below can rebind them while this callback runs.
+        schedule = self._schedule
+        cameras = self._active_cameras
+        now = self._total_capture_ns
+        heappop = heapq.heappop
+        fired: List[Tuple[int, int]] = []
+        while schedule and schedule[0][0] <= now:
+            deadline, index = heappop(schedule)
+            if not cameras[index].enabled:
+                # Dropped from the schedule; update_camera_enabled() re-adds it
                 continue
+            fired.append((deadline, index))
 
-            # Accumulate elapsed time for this camera
-            self._elapsed_time[camera.prim_path] += dt
+        if not fired:
+            return
 
-            # Calculate capture interval from FPS (e.g., 30 FPS = 0.0333s interval)
-            capture_interval = 1.0 / camera.fps
+        intervals = self._capture_intervals
+        frame_counts = self._frame_counts
+        heappush = heapq.heappush
+        due_cameras = []
+        for deadline, index in fired:
+            due_cameras.append(cameras[index])
+            # Track frame count for actual FPS calculation
+            frame_counts[index] += 1
+            heappush(schedule, (deadline + intervals[index], index))
 
-            # Capture when enough time has passed (and no step is pending)
-            if self._elapsed_time[camera.prim_path] >= capture_interval:
-                if not self._step_pending:
-                    self._elapsed_time[camera.prim_path] -= capture_interval
-                    self._trigger_capture(camera)
-                    # Track frame count for actual FPS calculation
-                    self._camera_frame_counts[camera.prim_path] = \
-                        self._camera_frame_counts.get(camera.prim_path, 0) + 1
-                # If step is pending, don't subtract time - we'll capture on next frame
+        # One orchestrator step captures every attached render product at once
+        self._capture_queue.put_nowait(due_cameras)
 
     def _check_fps_drops(self) -> None:
         """Check if any camera's target FPS exceeds measured app FPS and log warning."""
-        for cam in self._active_cameras:
-            if cam.enabled and cam.fps > self._measured_app_fps:
-                warning = (
-                    f"FPS drop: {cam.display_name} target {cam.fps} FPS, "
-                    f"app running at {self._measured_app_fps:.1f} FPS"
-                )
+        # Steady state: the app keeps up with every camera, nothing to format
+        if self._max_target_fps <= self._measured_app_fps:
+            return
+
+        suffix = f"app running at {self._measured_app_fps:.1f} FPS"
+        for cam in self._enabled_cameras:
+            if cam.fps > self._measured_app_fps:
+                warning = self._fps_warning_prefixes[cam.prim_path] + suffix
                 # Only log if this is a new warning (avoid spam)
                 if warning not in self._fps_drop_warnings:
-                    self._fps_drop_warnings.append(warning)
-                    print(f"[brian.camera_management] Warning: {warning}")
+                    self._fps_drop_warnings.add(warning)
+                    print(f"[brian.camera_management] {warning}")
 
-    def _trigger_capture(self, camera: CameraSettings) -> None:
+    @staticmethod
+    def _format_fps_warning_prefix(cam: CameraSettings) -> str:
+        """Format the per-camera part of an FPS drop warning.
+
+        Args:
+            cam: Camera settings to describe.
+
+        Returns:
+            Warning text up to the measured app FPS.
         """
-        Trigger a single frame capture.
+        return f"FPS drop: {cam.display_name} target {cam.fps} FPS, "
+
+    async def _consume_captures(self, queue: asyncio.Queue) -> None:
+        """Step the orchestrator once for each queued capture batch.
+
+        Runs until a None sentinel is received from stop_capture().
 
         Args:
-            camera: Camera settings for the camera to capture from.
+            queue: Queue of camera batches produced by _on_update.
         """
-        self._step_pending = True
+        while True:
+            cameras = await queue.get()
+            if cameras is None:
+                break
 
-        async def _do_capture():
             try:
-                # Step the orchestrator to capture with timeout to prevent freeze
+                # Step the orchestrator to capture with timeout to prevent freeze.
+                # Writers report each file through _on_writer_output once it is saved.
                 await asyncio.wait_for(rep.orchestrator.step_async(), timeout=5.0)
 
-                # Get the actual written path from the writer for callback
-                writer = self._writers.get(camera.prim_path)
-                if writer and hasattr(writer, 'last_written_path') and writer.last_written_path:
-                    if self._on_capture_callback:
-                        self._on_capture_callback(camera.display_name, writer.last_written_path)
-
+            # Only failed steps format a message; successful steps log nothing
             except asyncio.TimeoutError:
-                print(f"[brian.camera_management] Capture timeout for {camera.display_name}")
+                names = ", ".join(cam.display_name for cam in cameras)
+                print(f"[brian.camera_management] Capture timeout for {names}")
             except Exception as e:
-                print(f"[brian.camera_management] Capture error for {camera.display_name}: {e}")
-            finally:
-                self._step_pending = False
+                names = ", ".join(cam.display_name for cam in cameras)
+                print(f"[brian.camera_management] Capture error for {names}: {e}")
+
+    def _stop_consumer(self) -> Optional[asyncio.Future]:
+        """Discard queued capture batches and tell the consumer task to exit.
+
+        A step that is already running is allowed to finish; the task is kept
+        until then so start_capture() cannot start a second consumer.
+
+        Returns:
+            The consumer task, or None if no consumer was running.
+        """
+        queue = self._capture_queue
+        if queue is None:
+            return None
+
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
 
-        asyncio.ensure_future(_do_capture())
+        self._capture_queue = None
+        return self._consumer_task
 
     def stop_capture(self) -> None:
-        """Stop capture and clean up resources."""
+        """Stop capture and finalize writers without blocking the UI thread.
+
+        Updates stop and writers are detached right away. Writers are finalized
+        by a task once the IO executor has saved every queued frame.
+        """
         self._is_capturing = False
 
         # Calculate total capture duration
-        capture_duration = self._total_capture_time if self._total_capture_time > 0 else 0.001
+        capture_duration = self._total_capture_ns / _NS_PER_SECOND if self._total_capture_ns > 0 else 0.001
 
         # Unsubscribe from updates
         if self._update_subscription:
             self._update_subscription.unsubscribe()
             self._update_subscription = None
 
-        # Log capture summary and update VideoWriter FPS
+        consumer_task = self._stop_consumer()
+
+        # Log capture summary
         self._log_capture_summary(capture_duration)
 
-        # Finalize writers and extract last written paths
+        writer_cameras: List[Tuple[Any, Optional[CameraSettings]]] = []
         for prim_path, writer in self._writers.items():
+            # Indices are unset when setup fails part way through start_capture
+            index = self._camera_indices.get(prim_path)
+            camera = self._active_cameras[index] if index is not None else None
+            writer_cameras.append((writer, camera))
+
+            # For VideoWriter, update FPS to actual captured rate before encoding
+            if camera is not None and isinstance(writer, VideoWriter):
+                actual_frames = self._frame_counts[index]
+                if actual_frames > 0 and capture_duration > 0:
+                    writer.set_fps(actual_frames / capture_duration)
+
+            # Always detach writer to prevent resource leaks; queued frames are still saved
             try:
-                # For VideoWriter, update FPS to actual captured rate before encoding
-                if isinstance(writer, VideoWriter):
-                    actual_frames = self._camera_frame_counts.get(prim_path, 0)
-                    if actual_frames > 0 and capture_duration > 0:
-                        actual_fps = actual_frames / capture_duration
-                        writer.set_fps(actual_fps)
-
-                # Call on_final_frame for VideoWriter to finalize encoding
-                if hasattr(writer, 'on_final_frame'):
-                    writer.on_final_frame()
-
-                # Update camera's last_capture_path from writer's actual written path
-                if hasattr(writer, 'last_written_path') and writer.last_written_path:
-                    for cam in self._active_cameras:
-                        if cam.prim_path == prim_path:
-                            cam.last_capture_path = writer.last_written_path
-                            break
+                writer.detach()
             except Exception as e:
-                print(f"[brian.camera_management] Error finalizing writer: {e}")
-            finally:
-                # Always detach writer to prevent resource leaks
-                try:
-                    writer.detach()
-                except Exception as e:
-                    print(f"[brian.camera_management] Error detaching writer: {e}")
+                print(f"[brian.camera_management] Error detaching writer: {e}")
+
+        # The finalize task owns this session's writers and executor from here on.
+        # A repeated stop has nothing left to finalize and must not close the session early.
+        if writer_cameras or consumer_task is not None or self._io_executor is not None:
+            asyncio.ensure_future(
+                self._finalize_writers_async(consumer_task, self._io_executor, writer_cameras, self._session_id)
+            )
+        self._io_executor = None
 
         self._writers.clear()
         self._render_products.clear()
         self._active_cameras.clear()
-        self._elapsed_time.clear()
+        self._enabled_cameras.clear()
+        self._schedule.clear()
+        self._capture_intervals.clear()
+        self._camera_indices.clear()
 
         print("[brian.camera_management] Capture stopped")
 
+    async def _finalize_writers_async(
+        self,
+        consumer_task: Optional[asyncio.Future],
+        executor: Optional[ThreadPoolExecutor],
+        writer_cameras: List[Tuple[Any, Optional[CameraSettings]]],
+        session_id: int,
+    ) -> None:
+        """Finalize a stopped capture's writers once their queued frames are saved.
+
+        Args:
+            consumer_task: The capture's consumer task, or None if it never started.
+            executor: The capture's IO executor, or None if it was never created.
+            writer_cameras: Each writer with the settings of its camera, if known.
+            session_id: The capture's session id.
+        """
+        if consumer_task is not None:
+            # A step still running may hand writers more frames; wait for it to end
+            try:
+                await consumer_task
+            except Exception as e:
+                print(f"[brian.camera_management] Error in capture consumer: {e}")
+
+        if executor is not None:
+            # Drain on a worker thread so the UI keeps updating while frames are saved
+            await asyncio.get_event_loop().run_in_executor(None, executor.shutdown)
+
+        # Every queued image is on disk now, so the reported paths are final.
+        # Closing the session also ignores outputs reported after this point.
+        last_paths = self._session_paths.pop(session_id, {})
+        for _, camera in writer_cameras:
+            path = last_paths.get(camera.prim_path) if camera is not None else None
+            if path:
+                camera.last_capture_path = path
+
+        for writer, camera in writer_cameras:
+            try:
+                # Both writer types define on_final_frame (VideoWriter starts encoding here)
+                writer.on_final_frame()
+
+                # Encoding finishes after the session is closed, so its output is not
+                # reported; point at the expected video
+                if camera is not None and isinstance(writer, VideoWriter) and writer.frame_count > 0:
+                    camera.last_capture_path = writer.video_filepath
+            except Exception as e:
+                print(f"[brian.camera_management] Error finalizing writer: {e}")
+
     @property
     def is_capturing(self) -> bool:
         """Return whether capture is currently active."""
@@ -354,9 +609,12 @@ class CameraManager:
         Returns:
             List of warning messages for cameras that are FPS-capped.
         """
+        if self._max_target_fps <= self._measured_app_fps:
+            return []
+
         warnings = []
-        for cam in self._active_cameras:
-            if cam.enabled and cam.fps > self._measured_app_fps:
+        for cam in self._enabled_cameras:
+            if cam.fps > self._measured_app_fps:
                 warnings.append(
                     f"{cam.display_name}: Target {cam.fps} FPS capped by app ({self._measured_app_fps:.0f} FPS)"
                 )
@@ -368,26 +626,29 @@ class CameraManager:
         Args:
             capture_duration: Total capture duration in seconds.
         """
-        print(f"[brian.camera_management] === Capture Summary ===")
-        print(f"[brian.camera_management] Duration: {capture_duration:.2f}s")
+        lines = [
+            "[brian.camera_management] === Capture Summary ===",
+            f"[brian.camera_management] Duration: {capture_duration:.2f}s",
+        ]
 
-        for cam in self._active_cameras:
+        for cam, actual_frames in zip(self._active_cameras, self._frame_counts):
             if not cam.enabled:
                 continue
-
-            actual_frames = self._camera_frame_counts.get(cam.prim_path, 0)
             expected_frames = int(capture_duration * cam.fps)
             actual_fps = actual_frames / capture_duration if capture_duration > 0 else 0
 
             status = "OK" if actual_frames >= expected_frames * 0.95 else "DROPPED"
-            print(
+            lines.append(
                 f"[brian.camera_management] {cam.display_name}: "
                 f"{actual_frames}/{expected_frames} frames "
                 f"(actual: {actual_fps:.1f} FPS, target: {cam.fps} FPS) [{status}]"
             )
 
         if self._fps_drop_warnings:
-            print(f"[brian.camera_management] FPS warnings during capture: {len(self._fps_drop_warnings)}")
+            lines.append(f"[brian.camera_management] FPS warnings during capture: {len(self._fps_drop_warnings)}")
+
+        # Emit the table as one write
+        print("\n".join(lines))
 
     def update_camera_enabled(self, prim_path: str, enabled: bool) -> None:
         """Update writer attachment based on camera enabled state.
@@ -396,6 +657,24 @@ class CameraManager:
             prim_path: The camera's prim path.
             enabled: Whether the camera should be capturing.
         """
+        index = self._camera_indices.get(prim_path)
+        if index is not None:
+            # Settings are edited in place, so pick up any FPS change as well
+            self._capture_intervals[index] = _NS_PER_SECOND // self._active_cameras[index].fps
+            scheduled = any(entry[1] == index for entry in self._schedule)
+            if enabled and not scheduled:
+                self._schedule_camera(index)
+            elif not enabled and scheduled:
+                self._unschedule_camera(index)
+            self._enabled_cameras = [cam for cam in self._active_cameras if cam.enabled]
+            if enabled:
+                self._fps_warning_prefixes[prim_path] = self._format_fps_warning_prefix(
+                    self._active_cameras[index]
+                )
+            else:
+                self._fps_warning_prefixes.pop(prim_path, None)
+            self._max_target_fps = max((cam.fps for cam in self._enabled_cameras), default=0)
+
         writer = self._writers.get(prim_path)
         render_product = self._render_products.get(prim_path)
         if not writer or not render_product:
@@ -408,6 +687,58 @@ class CameraManager:
             # Detach writer to stop capturing
             writer.detach()
 
+    def _on_writer_output(self, session_id: int, camera: CameraSettings, path: str) -> None:
+        """Record a file written by a camera's writer.
+
+        Writers call this as soon as a file is on disk, which may be on an IO
+        worker thread, so reporting is handed to the event loop. Outputs from a
+        session whose writers were already finalized, such as video encodes that
+        finish after stop, are ignored.
+
+        Args:
+            session_id: Session id of the capture the writer belongs to.
+            camera: Settings of the camera the writer belongs to.
+            path: Path to the written file.
+        """
+        last_paths = self._session_paths.get(session_id)
+        if last_paths is None:
+            return
+        last_paths[camera.prim_path] = path
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._report_written_path, camera, path)
+
+    def _report_written_path(self, camera: CameraSettings, path: str) -> None:
+        """Update the camera's last capture path and notify the capture callback.
+
+        Args:
+            camera: Settings of the camera that wrote the file.
+            path: Path to the written file.
+        """
+        camera.last_capture_path = path
+        if self._on_capture_callback:
+            self._on_capture_callback(camera.display_name, path)
+
+    def _schedule_camera(self, index: int) -> None:
+        """Add a camera to the capture schedule, due one interval from now.
+
+        Args:
+            index: Index of the camera in the active camera list.
+        """
+        deadline = self._total_capture_ns + self._capture_intervals[index]
+        heapq.heappush(self._schedule, (deadline, index))
+
+    def _unschedule_camera(self, index: int) -> None:
+        """Remove a camera from the capture schedule.
+
+        Args:
+            index: Index of the camera in the active camera list.
+        """
+        self._schedule = [entry for entry in self._schedule if entry[1] != index]
+        heapq.heapify(self._schedule)
+
     def cleanup(self) -> None:
         """Release all resources."""
         self.stop_capture()
+        self._revoke_objects_changed_listener()
+        self._scene_cameras = None
+        self._scene_cameras_stage_id = None
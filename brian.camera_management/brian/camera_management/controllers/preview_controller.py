@@ -12,8 +12,6 @@
 
 from typing import Callable, Optional
 
-from omni.kit.viewport.utility import get_active_viewport
-
 __all__ = ["PreviewController"]
 
 
@@ -100,6 +98,9 @@ class PreviewController:
             self._restore_camera()
 
         try:
+            # Imported on first preview rather than when the extension loads
+            from omni.kit.viewport.utility import get_active_viewport
+
             viewport = get_active_viewport()
             if viewport is None:
                 return False
@@ -143,6 +144,8 @@ class PreviewController:
         """Restore the original viewport camera."""
         try:
             if self._original_camera_path:
+                from omni.kit.viewport.utility import get_active_viewport
+
                 viewport = get_active_viewport()
                 if viewport:
                     viewport.camera_path = self._original_camera_path
@@ -5,7 +5,9 @@ from typing import Optional
 import omni.ext
 import omni.kit.app
 import omni.ui as ui
+import omni.usd
 
+from .usd_camera_utils import UsdCameraUtils
 from .window import CameraManagementWindow
 
 
@@ -21,6 +23,11 @@ class CameraManagementExtension(omni.ext.IExt):
         self._window: Optional[CameraManagementWindow] = None
         self._menu = None
 
+        # Cached USD camera handles belong to the stage they were resolved on
+        self._stage_event_sub = omni.usd.get_context().get_stage_event_stream().create_subscription_to_pop(
+            self._on_stage_event, name="brian.camera_management stage events"
+        )
+
         ui.Workspace.set_show_window_fn(
             CameraManagementExtension.WINDOW_NAME,
             partial(self._show_window, None)
@@ -48,6 +55,9 @@ class CameraManagementExtension(omni.ext.IExt):
         print("[brian.camera_management] Extension shutdown")
 
         self._menu = None
+        self._stage_event_sub = None
+        UsdCameraUtils.clear_cache()
+        UsdCameraUtils.clear_pending_settings()
 
         if self._window:
             self._window.destroy()
@@ -56,6 +66,15 @@ class CameraManagementExtension(omni.ext.IExt):
         # Deregister the window factory
         ui.Workspace.set_show_window_fn(CameraManagementExtension.WINDOW_NAME, None)
 
+    def _on_stage_event(self, event) -> None:
+        """Clear cached camera handles when a stage is opened or closed.
+
+        Args:
+            event: The stage event.
+        """
+        if event.type in (int(omni.usd.StageEventType.OPENED), int(omni.usd.StageEventType.CLOSING)):
+            UsdCameraUtils.clear_cache()
+
     def _show_window(self, menu, value: bool):
         """Show or hide the window.
 
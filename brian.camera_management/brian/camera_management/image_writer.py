@@ -1,13 +1,23 @@
 """Custom image writer with configurable file naming."""
 
 import os
+import threading
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 
 import numpy as np
 from PIL import Image
 from omni.replicator.core import AnnotatorRegistry, Writer
 
+from .pending_writes import PendingWrites
+
+# libjpeg-turbo encoder used for JPEG output when present, PIL otherwise
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
 
 class ImageWriter(Writer):
     """Writer that saves RGB frames as images with custom naming.
@@ -16,11 +26,19 @@ class ImageWriter(Writer):
     and frame number.
     """
 
+    # Maximum frames queued on the executor before write() waits for the oldest
+    MAX_PENDING_WRITES = 32
+
     def __init__(
         self,
         output_dir: str,
         camera_name: str,
-        image_format: str = "png"
+        image_format: str = "png",
+        executor: Optional[Executor] = None,
+        on_write: Optional[Callable[[str], None]] = None,
+        capture_start_time: Optional[str] = None,
+        compress_level: int = 1,
+        create_output_dir: bool = True
     ):
         """Initialize the image writer.
 
@@ -28,17 +46,45 @@ class ImageWriter(Writer):
             output_dir: Output directory for image files.
             camera_name: Camera name to include in filenames.
             image_format: Image format (png, jpg). Defaults to png.
+            executor: Optional executor used to encode and save images off the
+                calling thread. Images are saved synchronously if not provided.
+            on_write: Optional callback called with each file path once the image
+                is on disk. Runs on the executor thread when one is provided.
+            capture_start_time: Timestamp to include in filenames. Defaults to
+                the current time.
+            compress_level: PNG zlib compression level (0-9). PNG is lossless at
+                every level; higher levels only trade encode time for file size.
+            create_output_dir: Whether to create output_dir if it is missing. Pass
+                False when the caller has already created it.
         """
         super().__init__()
         self._output_dir = output_dir
         self._camera_name = camera_name
         self._image_format = image_format.lower()
-        self._frame_count = 0
-        self._capture_start_time = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._compress_level = compress_level
+        self._frame_index = 0  # Frame number for the next filename
+        # Images on disk; saves finish on executor threads, so updates take the lock
+        self._saved_count = 0
+        self._saved_lock = threading.Lock()
+        self._capture_start_time = capture_start_time or datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Filename around the frame number: OutputDir/CameraName_StartTime_ and .format
+        self._path_prefix = os.path.join(
+            self._output_dir, f"{self._camera_name}_{self._capture_start_time}_"
+        )
+        self._path_suffix = f".{self._image_format}"
+        self._is_jpeg = self._image_format in ("jpg", "jpeg")
         self._last_written_path: Optional[str] = None
-
-        # Ensure output directory exists
-        os.makedirs(self._output_dir, exist_ok=True)
+        self._executor = executor
+        self._on_write = on_write
+        self._pending_writes = PendingWrites(self.MAX_PENDING_WRITES)  # Submitted saves
+        # Frame buffers returned by finished saves, reused by later writes. Saves
+        # return them on executor threads, so the pool is only touched under the lock
+        self._free_buffers: List[np.ndarray] = []
+        self._buffer_key: Optional[Tuple[tuple, np.dtype]] = None  # Shape and dtype of pooled buffers
+        self._buffer_lock = threading.Lock()
+
+        if create_output_dir:
+            os.makedirs(self._output_dir, exist_ok=True)
 
         # RGB annotator to get frame data
         self.annotators = [AnnotatorRegistry.get_annotator("rgb")]
@@ -56,34 +102,112 @@ class ImageWriter(Writer):
                 print("[brian.camera_management] No RGB data in frame")
                 return
 
-            frame = np.array(rgb_data)
-
-            # Convert RGBA to RGB if needed
+            frame = np.asarray(rgb_data)
             if len(frame.shape) == 3 and frame.shape[2] == 4:
                 frame = frame[:, :, :3]
 
+            # Take one packed copy the writer owns while the frame is queued,
+            # dropping alpha in the same pass for RGBA data
+            buffer = self._take_buffer(frame)
+            try:
+                np.copyto(buffer, frame)
+            except Exception:
+                self._release_buffer(buffer)
+                raise
+            frame = buffer
+
             # Build filename: CameraName_StartTime_FrameNumber.format
-            filename = f"{self._camera_name}_{self._capture_start_time}_{self._frame_count:06d}.{self._image_format}"
-            filepath = os.path.join(self._output_dir, filename)
+            filepath = f"{self._path_prefix}{self._frame_index:06d}{self._path_suffix}"
+            self._frame_index += 1
+
+            if self._executor is not None:
+                try:
+                    future = self._executor.submit(self._save_image, frame, filepath)
+                except RuntimeError:
+                    # Executor already shut down; fall through and save synchronously,
+                    # which returns the buffer to the pool like any other save
+                    pass
+                else:
+                    self._pending_writes.add(future)
+                    return
+
+            self._save_image(frame, filepath)
 
-            # Save image
-            img = Image.fromarray(frame)
-            if self._image_format == "jpg" or self._image_format == "jpeg":
-                img.save(filepath, quality=95)
+        except Exception as e:
+            print(f"[brian.camera_management] Error saving image: {e}")
+
+    def _take_buffer(self, frame: np.ndarray) -> np.ndarray:
+        """Get a free frame buffer matching a frame, allocating one if needed.
+
+        Reusing buffers avoids mapping fresh pages for every multi-megabyte frame.
+        The pool only keeps buffers of the latest frame shape.
+
+        Args:
+            frame: The frame that will be copied into the buffer.
+
+        Returns:
+            A C-contiguous buffer with the frame's shape and dtype.
+        """
+        key = (frame.shape, frame.dtype)
+        with self._buffer_lock:
+            if key != self._buffer_key:
+                # Resolution changed; drop buffers of the old size
+                self._buffer_key = key
+                self._free_buffers.clear()
+            elif self._free_buffers:
+                return self._free_buffers.pop()
+        return np.empty(frame.shape, dtype=frame.dtype)
+
+    def _release_buffer(self, buffer: np.ndarray):
+        """Return a frame buffer to the pool unless its shape is out of date.
+
+        Args:
+            buffer: Buffer taken with _take_buffer() that is no longer in use.
+        """
+        with self._buffer_lock:
+            if (buffer.shape, buffer.dtype) == self._buffer_key:
+                self._free_buffers.append(buffer)
+
+    def _save_image(self, frame: np.ndarray, filepath: str):
+        """Encode a frame and save it to disk.
+
+        Args:
+            frame: RGB frame data.
+            filepath: Destination file path.
+        """
+        try:
+            is_jpeg = self._is_jpeg
+            if is_jpeg and simplejpeg is not None:
+                with open(filepath, "wb") as f:
+                    f.write(simplejpeg.encode_jpeg(frame, quality=95, colorspace="RGB"))
             else:
-                img.save(filepath)
+                img = Image.fromarray(frame)
+                if is_jpeg:
+                    img.save(filepath, quality=95, optimize=False)
+                elif self._image_format == "png":
+                    img.save(filepath, compress_level=self._compress_level)
+                else:
+                    img.save(filepath)
 
             # Track last successfully written path
-            self._last_written_path = filepath
-            self._frame_count += 1
+            with self._saved_lock:
+                self._saved_count += 1
+                self._last_written_path = filepath
+            if self._on_write:
+                self._on_write(filepath)
 
         except Exception as e:
             print(f"[brian.camera_management] Error saving image: {e}")
 
+        finally:
+            # The encoder is done with the frame; let a later write reuse it
+            self._release_buffer(frame)
+
     def on_final_frame(self):
-        """Called when capture ends. Log summary."""
-        if self._frame_count > 0:
-            print(f"[brian.camera_management] ImageWriter: Saved {self._frame_count} images to {self._output_dir}")
+        """Called when capture ends. Wait for queued saves and log summary."""
+        self._pending_writes.wait_all()
+        if self._saved_count > 0:
+            print(f"[brian.camera_management] ImageWriter: Saved {self._saved_count} images to {self._output_dir}")
 
     @property
     def output_dir(self) -> str:
@@ -92,8 +216,8 @@ class ImageWriter(Writer):
 
     @property
     def frame_count(self) -> int:
-        """Return the number of frames captured."""
-        return self._frame_count
+        """Return the number of images saved so far."""
+        return self._saved_count
 
     @property
     def last_written_path(self) -> Optional[str]:
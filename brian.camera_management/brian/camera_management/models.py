@@ -3,6 +3,18 @@ from typing import Any, Dict, Optional
 from enum import Enum
 
 
+def short_name(prim_path: str) -> str:
+    """Get the last component of a prim path.
+
+    Args:
+        prim_path: The USD prim path.
+
+    Returns:
+        The prim name, e.g. "Camera_Front" for "/World/Camera_Front".
+    """
+    return prim_path.rpartition("/")[2]
+
+
 class CaptureStatus(Enum):
     """Status of the capture process."""
     STOPPED = "Stopped"
@@ -16,7 +28,7 @@ class CaptureMode(Enum):
     VIDEO = "Video"
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraSettings:
     """Settings for a single camera in the capture list."""
     prim_path: str
@@ -34,6 +46,15 @@ class CameraSettings:
     exposure: float = 0.0  # EV (exposure compensation)
     fov: float = 73.7  # degrees (calculated from 24mm focal length on 36mm sensor)
 
+    @property
+    def short_name(self) -> str:
+        """Get the last component of the camera prim path.
+
+        Returns:
+            The prim name, e.g. "Camera_Front" for "/World/Camera_Front".
+        """
+        return short_name(self.prim_path)
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize camera settings to a dictionary.
 
@@ -82,7 +103,7 @@ class CameraSettings:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalSettings:
     """Global capture settings."""
     output_folder: str = ""
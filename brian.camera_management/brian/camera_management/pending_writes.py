@@ -0,0 +1,55 @@
+"""Bounded tracking of frame saves submitted to an IO executor."""
+
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque
+
+__all__ = ["PendingWrites"]
+
+
+class PendingWrites:
+    """Futures of submitted saves, oldest first.
+
+    Each queued save holds a full frame copy, so add() waits for the oldest save
+    once limit saves are pending. Waiting re-raises a save's exception, so
+    failures reach the writer instead of being lost with the future.
+    """
+
+    def __init__(self, limit: int):
+        """Initialize the tracker.
+
+        Args:
+            limit: Maximum number of saves pending at once.
+        """
+        self._limit = limit
+        self._futures: Deque[Future] = deque()
+
+    def add(self, future: Future):
+        """Track a submitted save, waiting for the oldest one when too many are queued.
+
+        Args:
+            future: Future of the save that was just submitted.
+
+        Raises:
+            Exception: Any exception raised by a save that finished.
+        """
+        futures = self._futures
+        # Track the new save first so it is kept even if an older one raises
+        futures.append(future)
+        while futures and (futures[0].done() or len(futures) > self._limit):
+            futures.popleft().result()
+
+    def wait_all(self) -> int:
+        """Wait for every tracked save.
+
+        Returns:
+            Number of saves that raised an exception.
+        """
+        failed = 0
+        while self._futures:
+            try:
+                self._futures.popleft().result()
+            except Exception as e:
+                print(f"[brian.camera_management] Error saving frame: {e}")
+                failed += 1
+        return failed
@@ -4,6 +4,7 @@ from typing import List, Tuple
 
 import omni.replicator.core as rep
 import omni.usd
+from pxr import Sdf
 
 
 __all__ = ["SceneBuilder"]
@@ -189,12 +190,18 @@ class SceneBuilder:
                 print("[brian.camera_management] No stage available for cleanup")
                 return False
 
-            deleted_count = 0
-            for prim_path in cls._created_prims:
-                prim = stage.GetPrimAtPath(prim_path)
-                if prim and prim.IsValid():
+            # Skip duplicates and prims already removed by the user
+            prim_paths = [
+                prim_path for prim_path in dict.fromkeys(cls._created_prims)
+                if stage.GetPrimAtPath(prim_path).IsValid()
+            ]
+
+            # Batch the removals into one change notification, outside the undo
+            # stack so undo cannot bring back prims this class no longer tracks
+            with Sdf.ChangeBlock():
+                for prim_path in prim_paths:
                     stage.RemovePrim(prim_path)
-                    deleted_count += 1
+            deleted_count = len(prim_paths)
 
             cls._created_prims.clear()
             cls._created_camera_paths.clear()
@@ -1,5 +1,6 @@
 """State manager for persisting extension state."""
 
+import functools
 import json
 import os
 from typing import Any, Dict, List, Optional
@@ -8,12 +9,88 @@ import omni.kit.app
 
 from .models import CameraSettings
 
+# Faster JSON encoder/decoder used when present, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 __all__ = ["StateManager"]
 
 # State file schema version for future migrations
 STATE_VERSION = 1
 
 
+def _dumps(state: Dict[str, Any]) -> bytes:
+    """Serialize state to indented UTF-8 JSON.
+
+    Args:
+        state: The state dictionary.
+
+    Returns:
+        The encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    return json.dumps(state, indent=2).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a UTF-8 JSON document.
+
+    Args:
+        data: The encoded JSON document.
+
+    Returns:
+        The decoded value.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON (orjson's
+            error type subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_state_file_path(filename: str) -> str:
+    """Resolve the state file path and create its folder, once per process.
+
+    The extension path does not change while Kit is running, so every
+    StateManager shares the result.
+
+    Args:
+        filename: Name of the state file.
+
+    Returns:
+        Path to the state file in the extension data folder.
+    """
+    # Get extension data folder from Omniverse
+    app = omni.kit.app.get_app()
+    ext_manager = app.get_extension_manager()
+
+    # Get the extension's data path (user-writable location)
+    # Use get_extension_id_by_module to get the full versioned extension ID
+    ext_id = ext_manager.get_extension_id_by_module("brian.camera_management")
+    ext_path = ext_manager.get_extension_path(ext_id) if ext_id else None
+
+    if ext_path:
+        # Use a data subfolder within the extension path
+        data_folder = os.path.join(ext_path, "data")
+    else:
+        # Fallback to user documents
+        data_folder = os.path.join(
+            os.path.expanduser("~"),
+            "Documents",
+            "CameraCaptures",
+            ".state"
+        )
+
+    os.makedirs(data_folder, exist_ok=True)
+    return os.path.join(data_folder, filename)
+
+
 class StateManager:
     """Manages saving and loading extension state to/from disk.
 
@@ -24,7 +101,7 @@ class StateManager:
 
     def __init__(self):
         """Initialize the state manager."""
-        self._state_file_path: Optional[str] = None
+        self._last_saved: Optional[bytes] = None  # JSON last written by save_state()
 
     def _get_state_file_path(self) -> str:
         """Get the path to the state file.
@@ -32,33 +109,7 @@ class StateManager:
         Returns:
             Path to the state JSON file in the extension data folder.
         """
-        if self._state_file_path:
-            return self._state_file_path
-
-        # Get extension data folder from Omniverse
-        app = omni.kit.app.get_app()
-        ext_manager = app.get_extension_manager()
-
-        # Get the extension's data path (user-writable location)
-        # Use get_extension_id_by_module to get the full versioned extension ID
-        ext_id = ext_manager.get_extension_id_by_module("brian.camera_management")
-        ext_path = ext_manager.get_extension_path(ext_id) if ext_id else None
-
-        if ext_path:
-            # Use a data subfolder within the extension path
-            data_folder = os.path.join(ext_path, "data")
-        else:
-            # Fallback to user documents
-            data_folder = os.path.join(
-                os.path.expanduser("~"),
-                "Documents",
-                "CameraCaptures",
-                ".state"
-            )
-
-        os.makedirs(data_folder, exist_ok=True)
-        self._state_file_path = os.path.join(data_folder, self.STATE_FILENAME)
-        return self._state_file_path
+        return _resolve_state_file_path(self.STATE_FILENAME)
 
     def save_state(
         self,
@@ -87,9 +138,18 @@ class StateManager:
         }
 
         try:
+            payload = _dumps(state)
+            if payload == self._last_saved:
+                # UI edits often save identical state; skip the disk write
+                return True
+
+            # Write a temp file and swap it in, so a crash never leaves a torn state file
             state_path = self._get_state_file_path()
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2)
+            temp_path = state_path + ".tmp"
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+            os.replace(temp_path, state_path)
+            self._last_saved = payload
             return True
         except Exception as e:
             print(f"[brian.camera_management] Error saving state: {e}")
@@ -108,8 +168,8 @@ class StateManager:
             if not os.path.exists(state_path):
                 return None
 
-            with open(state_path, "r", encoding="utf-8") as f:
-                state = json.load(f)
+            with open(state_path, "rb") as f:
+                state = _loads(f.read())
 
             # Validate version
             version = state.get("version", 0)
@@ -149,6 +209,7 @@ class StateManager:
             state_path = self._get_state_file_path()
             if os.path.exists(state_path):
                 os.remove(state_path)
+            self._last_saved = None
             return True
         except Exception as e:
             print(f"[brian.camera_management] Error clearing state: {e}")
@@ -44,77 +44,83 @@ SPACING = 5
 LABEL_WIDTH = 120
 
 
+# Main window style, built once at import; omni.ui copies it when assigned to a frame
+_WINDOW_STYLE = {
+    # Window and frame styles
+    "Window": {
+        "background_color": COLORS["background_darker"]
+    },
+    "ScrollingFrame": {
+        "background_color": 0x00000000,  # Transparent
+    },
+
+    # Label styles
+    "Label": {
+        "color": COLORS["text"],
+    },
+
+    # Button styles
+    "Button": {
+        "background_color": COLORS["background"],
+    },
+    "Button:hovered": {
+        "background_color": 0xFF505050,
+    },
+
+    # CollapsableFrame styles
+    "CollapsableFrame": {
+        "background_color": 0x0,
+        "secondary_color": 0x0,
+    },
+    "CollapsableFrame:hovered": {
+        "background_color": 0x0,
+        "secondary_color": 0x0,
+    },
+    "CollapsableFrame::group": {
+        "background_color": 0x0,
+        "secondary_color": 0x0,
+        "margin_height": 2,
+    },
+
+    # Input field styles
+    "IntField": {
+        "background_color": COLORS["background_darker"],
+    },
+    "StringField": {
+        "background_color": COLORS["background_darker"],
+    },
+
+    # Slider styles
+    "IntSlider": {
+        "background_color": COLORS["background"],
+    },
+
+    # ComboBox styles
+    "ComboBox": {
+        "background_color": COLORS["background_darker"],
+    },
+
+    # CheckBox styles
+    "CheckBox": {
+        "background_color": COLORS["background_darker"],
+    },
+
+    # Custom collapsable header styles
+    "Image::collapsable_opened": {"color": cl.camera_mgmt_text, "image_url": url.camera_mgmt_icon_opened},
+    "Image::collapsable_closed": {"color": cl.camera_mgmt_text, "image_url": url.camera_mgmt_icon_closed},
+
+    "HeaderLine": {
+        "color": 0x338F8F8F,
+    },
+}
+
+
 def get_window_style() -> dict:
     """Get the main window style dictionary.
 
+    The same dictionary is returned on every call, so callers must not modify it.
+
     Returns:
         Style dictionary for omni.ui widgets.
     """
-    return {
-        # Window and frame styles
-        "Window": {
-            "background_color": COLORS["background_darker"]
-        },
-        "ScrollingFrame": {
-            "background_color": 0x00000000,  # Transparent
-        },
-
-        # Label styles
-        "Label": {
-            "color": COLORS["text"],
-        },
-
-        # Button styles
-        "Button": {
-            "background_color": COLORS["background"],
-        },
-        "Button:hovered": {
-            "background_color": 0xFF505050,
-        },
-
-        # CollapsableFrame styles
-        "CollapsableFrame": {
-            "background_color": 0x0,
-            "secondary_color": 0x0,
-        },
-        "CollapsableFrame:hovered": {
-            "background_color": 0x0,
-            "secondary_color": 0x0,
-        },
-        "CollapsableFrame::group": {
-            "background_color": 0x0,
-            "secondary_color": 0x0,
-            "margin_height": 2,
-        },
-
-        # Input field styles
-        "IntField": {
-            "background_color": COLORS["background_darker"],
-        },
-        "StringField": {
-            "background_color": COLORS["background_darker"],
-        },
-
-        # Slider styles
-        "IntSlider": {
-            "background_color": COLORS["background"],
-        },
-
-        # ComboBox styles
-        "ComboBox": {
-            "background_color": COLORS["background_darker"],
-        },
-
-        # CheckBox styles
-        "CheckBox": {
-            "background_color": COLORS["background_darker"],
-        },
-
-        # Custom collapsable header styles
-        "Image::collapsable_opened": {"color": cl.camera_mgmt_text, "image_url": url.camera_mgmt_icon_opened},
-        "Image::collapsable_closed": {"color": cl.camera_mgmt_text, "image_url": url.camera_mgmt_icon_closed},
-
-        "HeaderLine": {
-            "color": 0x338F8F8F,
-        },
-    }
+    return _WINDOW_STYLE
@@ -1,20 +1,44 @@
 """USD camera property utilities for reading and writing camera attributes."""
 
+import asyncio
 import math
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, NamedTuple, Optional, Tuple, TYPE_CHECKING
 
+import omni.kit.app
 import omni.usd
-from pxr import UsdGeom
+from pxr import Sdf, Usd, UsdGeom
 
 # Fixed sensor width for FOV calculations (35mm full-frame equivalent)
 SENSOR_WIDTH = 36.0  # mm
 
+# Angle conversion factors, folded so FOV math needs no degrees()/radians() calls
+_DEG_PER_RAD = 180.0 / math.pi
+_HALF_RAD_PER_DEG = math.pi / 360.0
+
 if TYPE_CHECKING:
     from .models import CameraSettings
 
 __all__ = ["UsdCameraUtils"]
 
 
+class _CameraHandles(NamedTuple):
+    """Resolved camera schema and the attributes the tool edits."""
+    camera: UsdGeom.Camera
+    focal_length: Usd.Attribute
+    focus_distance: Usd.Attribute
+    exposure: Usd.Attribute
+
+
+# (stage id, prim path) -> resolved handles; cleared when a stage opens or closes
+_CAMERA_CACHE: Dict[Tuple[int, str], _CameraHandles] = {}
+
+# prim path -> settings to write on the next app update
+_PENDING_SETTINGS: Dict[str, "CameraSettings"] = {}
+
+# Whether a flush of _PENDING_SETTINGS is waiting for the next app update
+_flush_scheduled = False
+
+
 class UsdCameraUtils:
     """Utility class for reading and writing USD camera properties."""
 
@@ -31,7 +55,7 @@ class UsdCameraUtils:
         """
         if focal_length <= 0:
             return 90.0
-        return math.degrees(2 * math.atan(h_aperture / (2 * focal_length)))
+        return 2.0 * math.atan(h_aperture / (2.0 * focal_length)) * _DEG_PER_RAD
 
     @staticmethod
     def calculate_focal_length(fov: float, h_aperture: float = SENSOR_WIDTH) -> float:
@@ -46,7 +70,7 @@ class UsdCameraUtils:
         """
         if fov <= 0 or fov >= 180:
             return 24.0
-        return h_aperture / (2 * math.tan(math.radians(fov / 2)))
+        return h_aperture / (2.0 * math.tan(fov * _HALF_RAD_PER_DEG))
 
     @staticmethod
     def get_camera_prim(prim_path: str) -> Optional[UsdGeom.Camera]:
@@ -58,7 +82,40 @@ class UsdCameraUtils:
         Returns:
             UsdGeom.Camera if found, None otherwise.
         """
+        handles = UsdCameraUtils._get_camera_handles(prim_path)
+        return handles.camera if handles else None
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached camera handles, e.g. when the stage changes."""
+        _CAMERA_CACHE.clear()
+
+    @staticmethod
+    def clear_pending_settings() -> None:
+        """Drop settings scheduled by schedule_apply_settings() but not yet written."""
+        _PENDING_SETTINGS.clear()
+
+    @staticmethod
+    def _get_camera_handles(prim_path: str) -> Optional[_CameraHandles]:
+        """Get cached camera and attribute handles for a prim path.
+
+        Resolves and caches them on first use for the current stage. A cached
+        entry is dropped if its prim has since been removed.
+
+        Args:
+            prim_path: The USD prim path to the camera.
+
+        Returns:
+            The camera handles if found, None otherwise.
+        """
         context = omni.usd.get_context()
+        key = (context.get_stage_id(), prim_path)
+        handles = _CAMERA_CACHE.get(key)
+        if handles is not None:
+            if handles.camera.GetPrim().IsValid():
+                return handles
+            del _CAMERA_CACHE[key]
+
         stage = context.get_stage()
         if not stage:
             return None
@@ -67,7 +124,15 @@ class UsdCameraUtils:
         if not prim or not prim.IsA(UsdGeom.Camera):
             return None
 
-        return UsdGeom.Camera(prim)
+        camera = UsdGeom.Camera(prim)
+        handles = _CameraHandles(
+            camera,
+            camera.GetFocalLengthAttr(),
+            camera.GetFocusDistanceAttr(),
+            camera.GetExposureAttr(),
+        )
+        _CAMERA_CACHE[key] = handles
+        return handles
 
     @staticmethod
     def get_camera_properties(prim_path: str) -> Dict[str, Any]:
@@ -79,18 +144,53 @@ class UsdCameraUtils:
         Returns:
             Dictionary with camera properties, empty if camera not found.
         """
-        camera = UsdCameraUtils.get_camera_prim(prim_path)
-        if not camera:
+        handles = UsdCameraUtils._get_camera_handles(prim_path)
+        if not handles:
             return {}
 
-        focal_length = camera.GetFocalLengthAttr().Get() or 24.0
+        focal_length = handles.focal_length.Get() or 24.0
         return {
             "focal_length": focal_length,
-            "focus_distance": camera.GetFocusDistanceAttr().Get() or 400.0,
-            "exposure": camera.GetExposureAttr().Get() or 0.0,
+            "focus_distance": handles.focus_distance.Get() or 400.0,
+            "exposure": handles.exposure.Get() or 0.0,
             "fov": UsdCameraUtils.calculate_fov(focal_length),
         }
 
+    @staticmethod
+    def set_attrs(
+        prim_path: str,
+        *,
+        focal_length: Optional[float] = None,
+        focus_distance: Optional[float] = None,
+        exposure: Optional[float] = None,
+    ) -> bool:
+        """Set any of the camera's edited attributes in one change block.
+
+        The camera is resolved once and only the values provided are written.
+
+        Args:
+            prim_path: The USD prim path to the camera.
+            focal_length: Focal length in millimeters.
+            focus_distance: Focus distance in centimeters.
+            exposure: Exposure value (EV).
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        handles = UsdCameraUtils._get_camera_handles(prim_path)
+        if not handles:
+            return False
+
+        # Coalesce the edits into one change notification
+        with Sdf.ChangeBlock():
+            if focal_length is not None:
+                handles.focal_length.Set(focal_length)
+            if focus_distance is not None:
+                handles.focus_distance.Set(focus_distance)
+            if exposure is not None:
+                handles.exposure.Set(exposure)
+        return True
+
     @staticmethod
     def set_focal_length(prim_path: str, value: float) -> bool:
         """Set camera focal length in mm.
@@ -102,11 +202,7 @@ class UsdCameraUtils:
         Returns:
             True if successful, False otherwise.
         """
-        camera = UsdCameraUtils.get_camera_prim(prim_path)
-        if not camera:
-            return False
-        camera.GetFocalLengthAttr().Set(value)
-        return True
+        return UsdCameraUtils.set_attrs(prim_path, focal_length=value)
 
     @staticmethod
     def set_focus_distance(prim_path: str, value: float) -> bool:
@@ -119,11 +215,7 @@ class UsdCameraUtils:
         Returns:
             True if successful, False otherwise.
         """
-        camera = UsdCameraUtils.get_camera_prim(prim_path)
-        if not camera:
-            return False
-        camera.GetFocusDistanceAttr().Set(value)
-        return True
+        return UsdCameraUtils.set_attrs(prim_path, focus_distance=value)
 
     @staticmethod
     def set_exposure(prim_path: str, value: float) -> bool:
@@ -136,11 +228,7 @@ class UsdCameraUtils:
         Returns:
             True if successful, False otherwise.
         """
-        camera = UsdCameraUtils.get_camera_prim(prim_path)
-        if not camera:
-            return False
-        camera.GetExposureAttr().Set(value)
-        return True
+        return UsdCameraUtils.set_attrs(prim_path, exposure=value)
 
     @staticmethod
     def sync_settings_from_usd(prim_path: str, settings: "CameraSettings") -> bool:
@@ -174,11 +262,41 @@ class UsdCameraUtils:
         Returns:
             True if successful, False otherwise.
         """
-        camera = UsdCameraUtils.get_camera_prim(prim_path)
-        if not camera:
-            return False
+        return UsdCameraUtils.set_attrs(
+            prim_path,
+            focal_length=settings.focal_length,
+            focus_distance=settings.focus_distance,
+            exposure=settings.exposure,
+        )
 
-        camera.GetFocalLengthAttr().Set(settings.focal_length)
-        camera.GetFocusDistanceAttr().Set(settings.focus_distance)
-        camera.GetExposureAttr().Set(settings.exposure)
-        return True
+    @staticmethod
+    def schedule_apply_settings(prim_path: str, settings: "CameraSettings") -> None:
+        """Apply CameraSettings to USD on the next app update.
+
+        Repeated calls within one frame, e.g. while dragging a slider, are
+        coalesced into a single write of the latest values.
+
+        Args:
+            prim_path: The USD prim path to the camera.
+            settings: CameraSettings instance with values to apply.
+        """
+        global _flush_scheduled
+        _PENDING_SETTINGS[prim_path] = settings
+        if not _flush_scheduled:
+            _flush_scheduled = True
+            asyncio.ensure_future(UsdCameraUtils._flush_pending_settings_async())
+
+    @staticmethod
+    async def _flush_pending_settings_async() -> None:
+        """Wait one frame, then apply all pending settings to USD."""
+        global _flush_scheduled
+        try:
+            await omni.kit.app.get_app().next_update_async()
+        finally:
+            # Reset even if cancelled, so later settings schedule a new flush
+            _flush_scheduled = False
+        pending = list(_PENDING_SETTINGS.items())
+        _PENDING_SETTINGS.clear()
+        with Sdf.ChangeBlock():
+            for prim_path, settings in pending:
+                UsdCameraUtils.apply_settings_to_usd(prim_path, settings)
@@ -1,20 +1,38 @@
 import asyncio
+import functools
 import os
+import queue
+import subprocess
 import tempfile
 import shutil
-from typing import Optional, Callable
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
 
 import numpy as np
 from PIL import Image
 from omni.replicator.core import AnnotatorRegistry, Writer
 
-# Install imageio at runtime if needed
+from .pending_writes import PendingWrites
+
+# OpenCV's SIMD resize is preferred for the temp-frame fallback when present
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# Install imageio at runtime if needed, on first VideoWriter use
 IMAGEIO_AVAILABLE = False
 imageio_module = None
+_imageio_setup_done = False
 
 def _setup_imageio():
-    """Setup imageio with video encoding backend."""
-    global IMAGEIO_AVAILABLE, imageio_module
+    """Setup imageio with video encoding backend. Only the first call does any work."""
+    global IMAGEIO_AVAILABLE, imageio_module, _imageio_setup_done
+    if _imageio_setup_done:
+        return
+    _imageio_setup_done = True
 
     def try_import():
         global imageio_module
@@ -56,15 +74,115 @@ def _setup_imageio():
 
     IMAGEIO_AVAILABLE = False
 
-_setup_imageio()
+# Keep ffmpeg from opening a console window on Windows
+_SUBPROCESS_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
 
 
-class VideoWriter(Writer):
-    """Writer that saves frames to temp files and converts to video on completion.
+# Encoder arguments: NVENC when the ffmpeg build and GPU driver support it, else x264
+_NVENC_ARGS = ["-c:v", "h264_nvenc", "-preset", "p4"]
+_X264_ARGS = ["-c:v", "libx264", "-preset", "veryfast"]
+
+# Longest stretch of encoder work between yields to the event loop, in seconds
+_ENCODE_YIELD_INTERVAL = 0.016
 
-    This approach supports long captures by saving frames to disk instead of memory,
-    and uses imageio[pyav] for cross-platform video encoding without system dependencies.
+# ffmpeg path -> whether a test NVENC encode succeeded; probed under the lock
+_nvenc_support: Dict[str, bool] = {}
+_nvenc_probe_lock = threading.Lock()
+
+# Consumer drivers cap concurrent NVENC sessions, and the test encode cannot see
+# the cap, so streams beyond this many use x264 instead
+_MAX_NVENC_SESSIONS = 3
+_nvenc_sessions = 0
+_nvenc_lock = threading.Lock()
+
+
+def _get_ffmpeg_exe() -> Optional[str]:
+    """Return the ffmpeg binary bundled with imageio-ffmpeg, or None if unavailable."""
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return None
+
+
+def _has_nvenc(ffmpeg_exe: str) -> bool:
+    """Check once per ffmpeg binary whether it can encode H.264 with NVENC.
+
+    Encodes one test frame rather than listing encoders, since a build may
+    include h264_nvenc without a usable GPU driver. The first call blocks for
+    the test encode, so it is made on the stream worker thread, never the UI thread.
+
+    Args:
+        ffmpeg_exe: Path to the ffmpeg binary.
+
+    Returns:
+        True if the test encode succeeded.
     """
+    with _nvenc_probe_lock:
+        if ffmpeg_exe not in _nvenc_support:
+            try:
+                result = subprocess.run(
+                    [
+                        ffmpeg_exe, "-hide_banner", "-loglevel", "error",
+                        "-f", "lavfi", "-i", "color=c=black:s=256x256",
+                        "-frames:v", "1", *_NVENC_ARGS, "-f", "null", "-",
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=10,
+                    creationflags=_SUBPROCESS_FLAGS
+                )
+                _nvenc_support[ffmpeg_exe] = result.returncode == 0
+            except Exception:
+                _nvenc_support[ffmpeg_exe] = False
+            if _nvenc_support[ffmpeg_exe]:
+                print("[brian.camera_management] Using NVENC for video encoding")
+        return _nvenc_support[ffmpeg_exe]
+
+
+def _acquire_nvenc_session() -> bool:
+    """Reserve one of the NVENC sessions shared by all VideoWriters.
+
+    Returns:
+        True if a session was reserved, False if all are in use.
+    """
+    global _nvenc_sessions
+    with _nvenc_lock:
+        if _nvenc_sessions >= _MAX_NVENC_SESSIONS:
+            return False
+        _nvenc_sessions += 1
+        return True
+
+
+def _release_nvenc_session():
+    """Return a session reserved by _acquire_nvenc_session()."""
+    global _nvenc_sessions
+    with _nvenc_lock:
+        _nvenc_sessions = max(0, _nvenc_sessions - 1)
+
+
+class VideoWriter(Writer):
+    """Writer that encodes frames to video while capturing.
+
+    Frames are piped as raw RGB into an ffmpeg process that encodes them to a raw
+    H.264 stream in a temp directory; on completion the stream is remuxed to MP4
+    at the final frame rate without re-encoding. If ffmpeg is unavailable, frames
+    are saved as temp PNG files and encoded with imageio on completion.
+
+    On the first frame a worker thread starts ffmpeg at the annotator's size, and
+    ffmpeg scales to the video size itself. write() only enqueues streamed frames;
+    the worker writes them to ffmpeg in order. When FRAME_QUEUE_SIZE frames are waiting, write()
+    blocks until the worker catches up, so frames are never dropped. Queued frames
+    are flushed to ffmpeg before the video is finalized. If ffmpeg exits during
+    capture, the frames it did not receive are saved as temp PNGs and appended to
+    what it encoded when the video is finalized.
+    """
+
+    # Frames buffered between write() and the ffmpeg worker thread
+    FRAME_QUEUE_SIZE = 64
+
+    # Maximum temp PNG saves queued on the executor before write() waits for the oldest
+    MAX_PENDING_WRITES = 32
 
     def __init__(
         self,
@@ -72,7 +190,9 @@ class VideoWriter(Writer):
         fps: int = 30,
         width: int = 640,
         height: int = 480,
-        on_encoding_complete: Optional[Callable[[str], None]] = None
+        on_encoding_complete: Optional[Callable[[Optional[str]], None]] = None,
+        executor: Optional[Executor] = None,
+        on_write: Optional[Callable[[str], None]] = None
     ):
         """
         Initialize the video writer.
@@ -82,9 +202,16 @@ class VideoWriter(Writer):
             fps: Frames per second for the output video.
             width: Video width in pixels.
             height: Video height in pixels.
-            on_encoding_complete: Optional callback called when video encoding finishes.
+            on_encoding_complete: Optional callback called when video encoding finishes,
+                with the written file path, or None if no file could be written.
+            executor: Optional executor used to resize and save temp PNG frames off
+                the calling thread when ffmpeg is unavailable. Frames are saved
+                synchronously if not provided.
+            on_write: Optional callback called with the output path once the video
+                (or fallback GIF) file has been written.
         """
         super().__init__()  # Required: Initialize parent Writer class
+        _setup_imageio()
         self._video_filepath = video_filepath
         self._fps = fps
         self._width = width
@@ -93,16 +220,30 @@ class VideoWriter(Writer):
         self._last_written_path: Optional[str] = None
         self._on_encoding_complete = on_encoding_complete
         self._encoding_in_progress = False
+        self._executor = executor
+        self._pending_writes = PendingWrites(self.MAX_PENDING_WRITES)  # Submitted temp PNG saves
+        self._on_write = on_write
 
-        # Create temp directory for frames
+        # Create temp directory for frames or the encoded stream
         self._temp_dir = tempfile.mkdtemp(prefix="video_capture_")
 
+        # Stream frames to ffmpeg when available, otherwise fall back to temp PNGs
+        self._ffmpeg_exe = _get_ffmpeg_exe() if IMAGEIO_AVAILABLE else None
+        self._uses_nvenc = False  # Whether this writer holds an NVENC session
+        self._stream_path = os.path.join(self._temp_dir, "stream.h264")
+        self._streaming = False  # Whether frames go to the stream worker thread
+        self._proc: Optional[subprocess.Popen] = None  # Started by the worker thread
+        self._stream_failed = False
+        self._streamed_count = 0  # Frames written to ffmpeg, counted on the worker thread
+        self._frame_queue: Optional[queue.Queue] = None
+        self._stream_thread: Optional[threading.Thread] = None
+
         # RGB annotator to get frame data
         self.annotators = [AnnotatorRegistry.get_annotator("rgb")]
 
     def write(self, data: dict):
         """
-        Save frame to temp file.
+        Stream frame to ffmpeg, or save it to a temp file as a fallback.
 
         Args:
             data: Dictionary containing annotator outputs, including "rgb" key.
@@ -115,29 +256,219 @@ class VideoWriter(Writer):
         try:
             # Get RGB data from annotator
             rgb_data = data["rgb"]
-            frame = np.array(rgb_data)
+            frame = np.asarray(rgb_data)
 
-            # Convert RGBA to RGB if needed
+            # Take one packed copy the writer owns while the frame is queued,
+            # dropping alpha in the same pass for RGBA data
             if len(frame.shape) == 3 and frame.shape[2] == 4:
-                frame = frame[:, :, :3]
-
-            # Resize if needed
-            if frame.shape[1] != self._width or frame.shape[0] != self._height:
-                img = Image.fromarray(frame)
-                img = img.resize((self._width, self._height), Image.LANCZOS)
-                frame = np.array(img)
+                frame = np.ascontiguousarray(frame[:, :, :3])
+            else:
+                frame = frame.copy()
+
+            # Start ffmpeg on the first frame so its input matches the annotator size
+            if self._frame_count == 0 and self._ffmpeg_exe and not self._streaming:
+                self._start_stream(frame.shape[1], frame.shape[0])
+
+            if self._streaming and not self._stream_failed:
+                # The worker thread writes frames to the pipe in queue order
+                self._frame_queue.put((self._frame_count, frame))
+                self._frame_count += 1
+                return
 
-            # Save frame as PNG to temp directory
-            frame_path = os.path.join(self._temp_dir, f"frame_{self._frame_count:06d}.png")
-            Image.fromarray(frame).save(frame_path)
+            frame_path = self._frame_path(self._frame_count)
             self._frame_count += 1
 
+            if self._executor is not None:
+                try:
+                    future = self._executor.submit(self._save_frame, frame, frame_path)
+                except RuntimeError:
+                    # Executor already shut down; fall through and save synchronously
+                    pass
+                else:
+                    self._pending_writes.add(future)
+                    return
+
+            self._save_frame(frame, frame_path)
+
+        except Exception as e:
+            print(f"[brian.camera_management] Error saving frame: {e}")
+
+    def _resize_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Resize a frame to the video size if it differs.
+
+        Args:
+            frame: RGB frame data.
+
+        Returns:
+            The frame at the video size.
+        """
+        if frame.shape[1] != self._width or frame.shape[0] != self._height:
+            if cv2 is not None:
+                # Area averaging for downscales, Lanczos to match PIL quality otherwise
+                downscale = frame.shape[1] > self._width
+                interpolation = cv2.INTER_AREA if downscale else cv2.INTER_LANCZOS4
+                return cv2.resize(frame, (self._width, self._height), interpolation=interpolation)
+            img = Image.fromarray(frame)
+            img = img.resize((self._width, self._height), Image.LANCZOS)
+            frame = np.array(img)
+        return frame
+
+    def _save_frame(self, frame: np.ndarray, frame_path: str):
+        """Resize a frame if needed and save it as PNG to the temp directory.
+
+        Args:
+            frame: RGB frame data.
+            frame_path: Destination file path.
+        """
+        try:
+            # Save frame as PNG to temp directory; it is read back once, so favour speed
+            Image.fromarray(self._resize_frame(frame)).save(frame_path, compress_level=1)
+
         except Exception as e:
             print(f"[brian.camera_management] Error saving frame: {e}")
 
+    def _start_stream(self, frame_width: int, frame_height: int):
+        """Start the worker thread that launches ffmpeg and pipes queued frames to it.
+
+        Frames are piped at their source size; ffmpeg scales them to the video
+        size when it differs, so no resize happens in Python.
+
+        Args:
+            frame_width: Width of the frames that will be piped.
+            frame_height: Height of the frames that will be piped.
+        """
+        self._streaming = True
+        self._frame_queue = queue.Queue(maxsize=self.FRAME_QUEUE_SIZE)
+        self._stream_thread = threading.Thread(
+            target=self._drain_frames, args=(frame_width, frame_height),
+            name="VideoWriterStream", daemon=True
+        )
+        self._stream_thread.start()
+
+    def _open_ffmpeg(self, frame_width: int, frame_height: int) -> bool:
+        """Launch the ffmpeg process that encodes piped raw frames to H.264.
+
+        Runs on the worker thread, so the NVENC probe and process start never
+        block the UI thread.
+
+        Args:
+            frame_width: Width of the frames that will be piped.
+            frame_height: Height of the frames that will be piped.
+
+        Returns:
+            True if ffmpeg was started.
+        """
+        filters = []
+        if frame_width != self._width or frame_height != self._height:
+            filters.append(f"scale={self._width}:{self._height}:flags=lanczos")
+        # yuv420p needs even dimensions
+        filters.append("pad=ceil(iw/2)*2:ceil(ih/2)*2")
+
+        self._uses_nvenc = _has_nvenc(self._ffmpeg_exe) and _acquire_nvenc_session()
+        encoder_args = _NVENC_ARGS if self._uses_nvenc else _X264_ARGS
+        command = [
+            self._ffmpeg_exe, "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgb24",
+            "-s", f"{frame_width}x{frame_height}", "-r", str(self._fps),
+            "-i", "-",
+            "-vf", ",".join(filters),
+            *encoder_args, "-pix_fmt", "yuv420p",
+            "-f", "h264", self._stream_path,
+        ]
+        try:
+            self._proc = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                bufsize=1 << 20,
+                creationflags=_SUBPROCESS_FLAGS
+            )
+        except Exception as e:
+            print(f"[brian.camera_management] Could not start ffmpeg, using temp frames: {e}")
+            self._proc = None
+            self._release_encoder()
+            return False
+        return True
+
+    def _drain_frames(self, frame_width: int, frame_height: int):
+        """Start ffmpeg, then write queued frames to it until the None sentinel is received.
+
+        If ffmpeg cannot start or exits, the remaining queued frames are saved as
+        temp PNGs.
+
+        Args:
+            frame_width: Width of the frames that will be piped.
+            frame_height: Height of the frames that will be piped.
+        """
+        if not self._open_ffmpeg(frame_width, frame_height):
+            self._stream_failed = True
+        while True:
+            item = self._frame_queue.get()
+            if item is None:
+                break
+            index, frame = item
+            if not self._pipe_frame(frame):
+                self._save_frame(frame, self._frame_path(index))
+
+    def _join_stream_thread(self):
+        """Flush queued frames to ffmpeg and stop the worker thread."""
+        if self._stream_thread is None:
+            return
+        self._frame_queue.put(None)
+        self._stream_thread.join()
+        self._stream_thread = None
+
+    def _pipe_frame(self, frame: np.ndarray) -> bool:
+        """Write one raw RGB frame to the ffmpeg process.
+
+        Args:
+            frame: RGB frame data.
+
+        Returns:
+            True if the frame was written, False otherwise.
+        """
+        if self._stream_failed:
+            return False
+        try:
+            # Frames are C-contiguous, so the buffer is written without a copy
+            self._proc.stdin.write(frame.data)
+            self._streamed_count += 1
+            return True
+        except Exception as e:
+            # ffmpeg exited; report once, later frames go to temp PNGs
+            self._stream_failed = True
+            print(f"[brian.camera_management] Error streaming frame to ffmpeg: {e}")
+            return False
+
+    def _stop_stream(self):
+        """Terminate the ffmpeg process without producing a video."""
+        if not self._streaming:
+            return
+        self._join_stream_thread()
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+                self._proc.wait()
+            except Exception:
+                pass
+        self._proc = None
+        self._streaming = False
+        self._release_encoder()
+
+    def _release_encoder(self):
+        """Give back this writer's NVENC session, if it holds one."""
+        if self._uses_nvenc:
+            self._uses_nvenc = False
+            _release_nvenc_session()
+
     def on_final_frame(self):
         """Start async video encoding. Returns immediately to avoid blocking UI."""
+        # Temp PNG saves are done once the executor has drained; collect their errors
+        self._pending_writes.wait_all()
+
         if self._frame_count == 0:
+            self._stop_stream()
             self._cleanup()
             return
 
@@ -146,96 +477,275 @@ class VideoWriter(Writer):
             self._cleanup()
             return
 
-        # Set expected path immediately so stop_capture() can read it
-        # (will be updated to .gif path if MP4 encoding fails)
+        # Set expected path immediately so stop_capture() can read it; it is replaced
+        # by the actual output (a GIF if MP4 encoding fails) or None when encoding ends
         self._last_written_path = self._video_filepath
 
         # Start async encoding to avoid blocking UI
         self._encoding_in_progress = True
-        asyncio.ensure_future(self._encode_video_async())
+        if self._streaming:
+            asyncio.ensure_future(self._finish_stream_async())
+        else:
+            asyncio.ensure_future(self._encode_video_async())
+
+    async def _finish_stream_async(self):
+        """Finalize the ffmpeg stream and report the written video."""
+        output_path = None
+        try:
+            output_path = await self._finalize_stream_async()
+        except Exception as e:
+            print(f"[brian.camera_management] Error creating video: {e}")
+        finally:
+            self._proc = None
+            self._streaming = False
+            self._release_encoder()
+            self._encoding_in_progress = False
+            self._cleanup()
+        self._notify_complete(output_path)
 
-    async def _encode_video_async(self):
-        """Encode video frames asynchronously to prevent UI freeze."""
+    async def _finalize_stream_async(self) -> Optional[str]:
+        """Flush the ffmpeg stream and remux it to MP4 at the final frame rate.
+
+        If ffmpeg exited during capture, the video is rebuilt from the partial
+        stream and the temp PNGs of the frames it did not receive instead.
+
+        Returns:
+            Path of the written file, or None if no file could be written.
+        """
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._join_stream_thread)
+        if self._proc is None:
+            # ffmpeg never started, so every frame was saved as a temp PNG
+            return await self._encode_temp_frames_async()
         try:
-            # Get sorted frame files
-            frame_files = sorted([
-                os.path.join(self._temp_dir, f)
-                for f in os.listdir(self._temp_dir)
-                if f.endswith('.png')
-            ])
-
-            if not frame_files:
-                print("[brian.camera_management] No frames to encode")
-                return
+            self._proc.stdin.close()
+        except Exception:
+            # Broken pipe is reported by the exit code below
+            pass
+        returncode = await loop.run_in_executor(None, self._proc.wait)
+
+        if returncode == 0 and not self._stream_failed:
+            # The stream has no timestamps, so set_fps() still applies here
+            result = await self._run_ffmpeg_async(
+                "-r", str(self._fps), "-i", self._stream_path, "-c", "copy", self._video_filepath
+            )
+            if result.returncode != 0:
+                print(f"[brian.camera_management] Error remuxing video: {self._ffmpeg_error(result)}")
+                return None
+            print(f"[brian.camera_management] Video saved: {self._video_filepath} ({self._frame_count} frames)")
+            return self._video_filepath
+
+        print(f"[brian.camera_management] ffmpeg exited during capture (exit code {returncode}); "
+              f"{self._streamed_count} of {self._frame_count} frames were streamed")
+        return await self._recover_stream_async()
+
+    async def _recover_stream_async(self) -> Optional[str]:
+        """Build the video after ffmpeg exited during capture.
+
+        Frames before _streamed_count went to ffmpeg and the rest were saved as
+        temp PNGs, so the partial stream and the PNGs are concatenated in capture
+        order and re-encoded with x264. Frames ffmpeg received but had not encoded
+        when it exited are missing from the result.
+
+        Returns:
+            Path of the written file, or None if no file could be written.
+        """
+        stream_path = self._stream_path
+        if self._streamed_count == 0 or not os.path.exists(stream_path) or os.path.getsize(stream_path) == 0:
+            # Nothing was recovered from the stream, so only the temp PNGs remain
+            return await self._encode_temp_frames_async()
+
+        tail_count = self._frame_count - self._streamed_count
+        if tail_count > 0:
+            result = await self._run_ffmpeg_async(
+                "-r", str(self._fps), "-i", stream_path,
+                "-framerate", str(self._fps), "-start_number", str(self._streamed_count),
+                "-i", os.path.join(self._temp_dir, "frame_%06d.png"),
+                # Temp PNGs are at the video size; pad them like the stream was
+                "-filter_complex",
+                "[0:v]setsar=1[head];"
+                "[1:v]pad=ceil(iw/2)*2:ceil(ih/2)*2,setsar=1,format=yuv420p[tail];"
+                "[head][tail]concat=n=2:v=1[v]",
+                "-map", "[v]", *_X264_ARGS, "-pix_fmt", "yuv420p", self._video_filepath,
+            )
+            if result.returncode == 0:
+                print(f"[brian.camera_management] Video saved: {self._video_filepath} "
+                      f"({self._streamed_count} streamed + {tail_count} recovered frames)")
+                return self._video_filepath
+            print(f"[brian.camera_management] Error recovering video frames: {self._ffmpeg_error(result)}")
+
+        # Keep what ffmpeg encoded rather than losing the whole capture
+        result = await self._run_ffmpeg_async(
+            "-r", str(self._fps), "-i", stream_path, "-c", "copy", self._video_filepath
+        )
+        if result.returncode != 0:
+            print(f"[brian.camera_management] Error remuxing video: {self._ffmpeg_error(result)}")
+            return None
+        print(f"[brian.camera_management] Video incomplete: {self._video_filepath} has only the "
+              f"frames ffmpeg encoded before exiting ({self._streamed_count} of {self._frame_count} streamed)")
+        return self._video_filepath
 
-            print(f"[brian.camera_management] Encoding {len(frame_files)} frames to video (async)...")
+    async def _run_ffmpeg_async(self, *args: str) -> subprocess.CompletedProcess:
+        """Run ffmpeg on a worker thread.
 
-            # Try MP4 encoding with ffmpeg backend
-            video_created = False
-            try:
-                writer = imageio_module.get_writer(
-                    self._video_filepath,
-                    fps=self._fps,
-                    codec='libx264',
-                    pixelformat='yuv420p'
-                )
-                for i, frame_file in enumerate(frame_files):
-                    frame = imageio_module.imread(frame_file)
-                    # Ensure RGB (not RGBA)
-                    if len(frame.shape) == 3 and frame.shape[2] == 4:
-                        frame = frame[:, :, :3]
-                    writer.append_data(frame)
-
-                    # Yield control every 10 frames to keep UI responsive
-                    if i % 10 == 0:
-                        await asyncio.sleep(0)
-
-                writer.close()
-                video_created = True
-                self._last_written_path = self._video_filepath
-                print(f"[brian.camera_management] Video saved: {self._video_filepath} ({self._frame_count} frames)")
-            except Exception as mp4_error:
-                print(f"[brian.camera_management] MP4 encoding failed: {mp4_error}")
-
-            # Fallback to GIF if MP4 failed
-            if not video_created:
-                gif_path = self._video_filepath.rsplit('.', 1)[0] + '.gif'
-                try:
-                    print("[brian.camera_management] Falling back to GIF format...")
-                    frames = []
-                    for i, f in enumerate(frame_files):
-                        frame = imageio_module.imread(f)
-                        # Convert RGBA to RGB
-                        if len(frame.shape) == 3 and frame.shape[2] == 4:
-                            frame = frame[:, :, :3]
-                        frames.append(frame)
-                        # Yield control periodically
-                        if i % 10 == 0:
-                            await asyncio.sleep(0)
-
-                    imageio_module.mimsave(gif_path, frames, fps=self._fps)
-                    self._last_written_path = gif_path
-                    print(f"[brian.camera_management] GIF saved: {gif_path} ({self._frame_count} frames)")
-                except Exception as gif_error:
-                    print(f"[brian.camera_management] GIF encoding also failed: {gif_error}")
-
-            # Notify completion if callback provided
-            if self._on_encoding_complete and self._last_written_path:
-                self._on_encoding_complete(self._last_written_path)
+        Args:
+            *args: Arguments after the common ffmpeg options.
+
+        Returns:
+            The completed process, with stderr captured.
+        """
+        return await asyncio.get_event_loop().run_in_executor(None, functools.partial(
+            subprocess.run,
+            [self._ffmpeg_exe, "-y", "-loglevel", "error", *args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            creationflags=_SUBPROCESS_FLAGS
+        ))
+
+    @staticmethod
+    def _ffmpeg_error(result: subprocess.CompletedProcess) -> str:
+        """Get the error message of a failed ffmpeg run.
+
+        Args:
+            result: The completed process.
+
+        Returns:
+            The decoded stderr output.
+        """
+        return result.stderr.decode(errors="replace").strip()
 
+    async def _encode_video_async(self):
+        """Encode the temp frames and report the written video."""
+        output_path = None
+        try:
+            output_path = await self._encode_temp_frames_async()
         except Exception as e:
             print(f"[brian.camera_management] Error creating video: {e}")
         finally:
             self._encoding_in_progress = False
             self._cleanup()
+        self._notify_complete(output_path)
+
+    async def _encode_temp_frames_async(self) -> Optional[str]:
+        """Encode temp frames asynchronously to prevent UI freeze.
+
+        Temp frames are always RGB: write() drops alpha before saving them.
+
+        Returns:
+            Path of the MP4, or of the GIF fallback, or None if both failed.
+        """
+        print(f"[brian.camera_management] Encoding {self._frame_count} frames to video (async)...")
+
+        # Try MP4 encoding with ffmpeg backend
+        try:
+            writer = imageio_module.get_writer(
+                self._video_filepath,
+                fps=self._fps,
+                codec='libx264',
+                pixelformat='yuv420p'
+            )
+            last_yield = time.monotonic()
+            async for frame in self._read_frames_async():
+                writer.append_data(frame)
+
+                # Yield control about once per UI frame, regardless of frame size
+                now = time.monotonic()
+                if now - last_yield >= _ENCODE_YIELD_INTERVAL:
+                    await asyncio.sleep(0)
+                    last_yield = time.monotonic()
+
+            writer.close()
+            print(f"[brian.camera_management] Video saved: {self._video_filepath} ({self._frame_count} frames)")
+            return self._video_filepath
+        except Exception as mp4_error:
+            print(f"[brian.camera_management] MP4 encoding failed: {mp4_error}")
+
+        # Fallback to GIF if MP4 failed
+        gif_path = self._video_filepath.rsplit('.', 1)[0] + '.gif'
+        try:
+            print("[brian.camera_management] Falling back to GIF format...")
+            frames = []
+            last_yield = time.monotonic()
+            async for frame in self._read_frames_async():
+                frames.append(frame)
+                # Yield control periodically
+                now = time.monotonic()
+                if now - last_yield >= _ENCODE_YIELD_INTERVAL:
+                    await asyncio.sleep(0)
+                    last_yield = time.monotonic()
+
+            imageio_module.mimsave(gif_path, frames, fps=self._fps)
+            print(f"[brian.camera_management] GIF saved: {gif_path} ({self._frame_count} frames)")
+            return gif_path
+        except Exception as gif_error:
+            print(f"[brian.camera_management] GIF encoding also failed: {gif_error}")
+        return None
+
+    def _notify_complete(self, output_path: Optional[str]):
+        """Record the encoding result and notify the callbacks.
+
+        Args:
+            output_path: Path of the written file, or None if encoding failed.
+        """
+        self._last_written_path = output_path
+        if self._on_write and output_path:
+            self._on_write(output_path)
+        if self._on_encoding_complete:
+            self._on_encoding_complete(output_path)
+
+    def _frame_path(self, index: int) -> str:
+        """Get the temp PNG path of a frame.
+
+        Args:
+            index: Capture index of the frame.
+
+        Returns:
+            Path of the frame in the temp directory.
+        """
+        return os.path.join(self._temp_dir, f"frame_{index:06d}.png")
+
+    def _frame_paths(self):
+        """Yield temp frame paths in capture order.
+
+        Frame files are named by zero-padded index, so no directory listing
+        or sort is needed.
+        """
+        for i in range(self._frame_count):
+            yield self._frame_path(i)
+
+    async def _read_frames_async(self):
+        """Yield temp frames in capture order, decoding ahead on a worker thread.
+
+        The next frame is read while the caller encodes the current one. Frames
+        that failed to save during capture, or went to ffmpeg instead, are skipped.
+        A frame that is already decoded is returned without suspending, so the
+        caller decides when to yield.
+        """
+        def read(path):
+            try:
+                return imageio_module.imread(path)
+            except FileNotFoundError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="VideoFrameRead") as pool:
+            pending = None
+            for path in self._frame_paths():
+                next_pending = pool.submit(read, path)
+                if pending is not None:
+                    frame = pending.result() if pending.done() else await asyncio.wrap_future(pending)
+                    if frame is not None:
+                        yield frame
+                pending = next_pending
+            if pending is not None:
+                frame = pending.result() if pending.done() else await asyncio.wrap_future(pending)
+                if frame is not None:
+                    yield frame
 
     def _cleanup(self):
         """Remove temp directory and files."""
-        if self._temp_dir and os.path.exists(self._temp_dir):
-            try:
-                shutil.rmtree(self._temp_dir, ignore_errors=True)
-            except Exception as e:
-                print(f"[brian.camera_management] Error cleaning up temp files: {e}")
+        if self._temp_dir:
+            # ignore_errors also covers a directory that is already gone
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
             self._temp_dir = None
 
     @property
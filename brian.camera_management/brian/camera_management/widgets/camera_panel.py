@@ -1,14 +1,16 @@
 """Camera panel widget for individual camera settings."""
 
+import asyncio
 import os
 import subprocess
 import sys
 from dataclasses import dataclass
 from typing import Callable, List, Optional, Set
 
+import omni.kit.app
 import omni.ui as ui
 
-from ..models import CameraSettings, CaptureMode
+from ..models import CameraSettings, CaptureMode, short_name
 from ..styles import COLORS, SPACING
 from ..usd_camera_utils import UsdCameraUtils
 from .resolution_widget import ResolutionWidget
@@ -63,12 +65,15 @@ class CameraPanelWidget:
         self._index = index
         self._settings = settings
         self._all_cameras = all_cameras
+        self._camera_names = self._get_camera_names(all_cameras)
         self._cameras_in_use = cameras_in_use
         self._is_previewing = is_previewing
         self._callbacks = callbacks
 
         # Widget references
         self._frame: Optional[ui.CollapsableFrame] = None
+        self._selector_frame: Optional[ui.Frame] = None
+        self._preview_button: Optional[ui.Button] = None
         self._width_widget: Optional[ResolutionWidget] = None
         self._height_widget: Optional[ResolutionWidget] = None
         self._status_label: Optional[ui.Label] = None
@@ -118,6 +123,76 @@ class CameraPanelWidget:
 
         return self._frame
 
+    def destroy(self):
+        """Remove this panel's frame from the UI.
+
+        The frame is hidden at once and destroyed on the next frame, since this
+        is usually called from the panel's own Remove button.
+        """
+        if self._frame:
+            frame = self._frame
+            frame.visible = False
+            self._frame = None
+
+            async def _destroy_frame():
+                await omni.kit.app.get_app().next_update_async()
+                frame.destroy()
+
+            asyncio.ensure_future(_destroy_frame())
+        self._selector_frame = None
+        self._preview_button = None
+
+    def set_index(self, index: int):
+        """Update the panel index after panels before it were removed.
+
+        Args:
+            index: The new index of this camera in the list.
+        """
+        self._index = index
+        if self._frame:
+            self._frame.title = f"Camera_{index}"
+
+    def set_camera_choices(self, all_cameras: List[str], cameras_in_use: Set[str]):
+        """Update the camera dropdown without rebuilding the rest of the panel.
+
+        Args:
+            all_cameras: List of all available camera prim paths.
+            cameras_in_use: Set of camera paths already in use by other panels.
+        """
+        if all_cameras != self._all_cameras:
+            self._camera_names = self._get_camera_names(all_cameras)
+        self._all_cameras = all_cameras
+        self._cameras_in_use = cameras_in_use
+        if self._selector_frame:
+            self._selector_frame.rebuild()
+
+    @staticmethod
+    def _get_camera_names(all_cameras: List[str]) -> List[str]:
+        """Get the dropdown label for each camera path.
+
+        Args:
+            all_cameras: List of camera prim paths.
+
+        Returns:
+            The prim name of each camera, in the same order.
+        """
+        return [short_name(cam_path) for cam_path in all_cameras]
+
+    def set_previewing(self, is_previewing: bool):
+        """Update the preview button for the current preview state.
+
+        Args:
+            is_previewing: Whether this camera is currently being previewed.
+        """
+        if is_previewing == self._is_previewing:
+            return
+        self._is_previewing = is_previewing
+        if self._preview_button:
+            self._preview_button.text = "Exit Preview" if is_previewing else "Preview"
+            self._preview_button.style = {
+                "background_color": COLORS["danger"] if is_previewing else COLORS["primary"]
+            }
+
     def _build_enabled_checkbox(self):
         """Build the enabled checkbox row."""
         with ui.HStack(height=25, spacing=SPACING):
@@ -200,6 +275,11 @@ class CameraPanelWidget:
             self._last_capture_label.text = self._settings.last_capture_path or ""
 
     def _build_camera_selector(self):
+        """Build the camera selection row in a frame that set_camera_choices() rebuilds."""
+        self._selector_frame = ui.Frame(height=25)
+        self._selector_frame.set_build_fn(self._build_camera_selector_row)
+
+    def _build_camera_selector_row(self):
         """Build the camera selection dropdown row."""
         with ui.HStack(height=25, spacing=SPACING):
             ui.Label("Camera:", width=70)
@@ -210,8 +290,7 @@ class CameraPanelWidget:
                 selectable_indices = []
                 current_index = 0
 
-                for i, cam_path in enumerate(self._all_cameras):
-                    cam_name = cam_path.split("/")[-1]
+                for i, (cam_path, cam_name) in enumerate(zip(self._all_cameras, self._camera_names)):
                     if cam_path in self._cameras_in_use:
                         display_items.append(f"{cam_name} (in use)")
                     else:
@@ -228,7 +307,7 @@ class CameraPanelWidget:
                     selected = model.get_item_value_model().get_value_as_int()
                     if selected in selectable_indices:
                         self._settings.prim_path = self._all_cameras[selected]
-                        self._settings.display_name = self._all_cameras[selected].split("/")[-1]
+                        self._settings.display_name = self._settings.short_name
                         self._notify_settings_changed()
                     else:
                         # Reset to current camera (reject selection of in-use camera)
@@ -376,8 +455,8 @@ class CameraPanelWidget:
         # Calculate corresponding focal length
         focal_length = UsdCameraUtils.calculate_focal_length(value)
         self._settings.focal_length = focal_length
-        # Update USD
-        UsdCameraUtils.set_focal_length(self._settings.prim_path, focal_length)
+        # Update USD on the next frame
+        UsdCameraUtils.schedule_apply_settings(self._settings.prim_path, self._settings)
         # Update focal length widget display
         if self._focal_length_widget:
             self._focal_length_widget.set_value(focal_length)
@@ -390,7 +469,7 @@ class CameraPanelWidget:
             value: The new focal length in mm.
         """
         self._settings.focal_length = value
-        UsdCameraUtils.set_focal_length(self._settings.prim_path, value)
+        UsdCameraUtils.schedule_apply_settings(self._settings.prim_path, self._settings)
         # Calculate corresponding FOV and update widget
         fov = UsdCameraUtils.calculate_fov(value)
         self._settings.fov = fov
@@ -399,23 +478,23 @@ class CameraPanelWidget:
         self._notify_settings_changed()
 
     def _on_focus_distance_changed(self, value: float):
-        """Handle focus distance change - update USD immediately.
+        """Handle focus distance change - update USD on the next frame.
 
         Args:
             value: The new focus distance in cm.
         """
         self._settings.focus_distance = value
-        UsdCameraUtils.set_focus_distance(self._settings.prim_path, value)
+        UsdCameraUtils.schedule_apply_settings(self._settings.prim_path, self._settings)
         self._notify_settings_changed()
 
     def _on_exposure_changed(self, value: float):
-        """Handle exposure change - update USD immediately.
+        """Handle exposure change - update USD on the next frame.
 
         Args:
             value: The new exposure value in EV.
         """
         self._settings.exposure = value
-        UsdCameraUtils.set_exposure(self._settings.prim_path, value)
+        UsdCameraUtils.schedule_apply_settings(self._settings.prim_path, self._settings)
         self._notify_settings_changed()
 
     def _sync_from_usd(self):
@@ -437,7 +516,7 @@ class CameraPanelWidget:
         btn_text = "Exit Preview" if self._is_previewing else "Preview"
         btn_color = COLORS["danger"] if self._is_previewing else COLORS["primary"]
 
-        ui.Button(
+        self._preview_button = ui.Button(
             btn_text,
             height=25,
             clicked_fn=lambda: self._callbacks.on_preview(self._index),
@@ -5,6 +5,8 @@ from typing import Callable, Optional
 import omni.ui as ui
 
 from ..styles import SPACING
+from .model_sync import ModelSync
+from .slider_throttle import SliderThrottle
 
 __all__ = ["CameraPropertyWidget"]
 
@@ -14,8 +16,14 @@ class CameraPropertyWidget:
 
     The slider and field are kept in sync - changing one updates the other.
     Similar to ResolutionWidget but handles float values with configurable precision.
+
+    While the slider is dragged, on_change is throttled to at most
+    SLIDER_NOTIFY_RATE calls per second; the final value is always sent on release.
     """
 
+    # Maximum on_change calls per second while dragging the slider
+    SLIDER_NOTIFY_RATE = 30.0
+
     def __init__(
         self,
         label: str,
@@ -49,6 +57,7 @@ class CameraPropertyWidget:
         self._value = initial
         self._step = step
         self._precision = precision
+        self._scale = 10 ** precision  # Rounding by integer scaling, see _round()
         self._unit = unit
         self._label_width = label_width
         self._field_width = field_width
@@ -58,8 +67,19 @@ class CameraPropertyWidget:
         self._slider: Optional[ui.FloatSlider] = None
         self._field: Optional[ui.FloatField] = None
 
-        # Prevent recursive updates
-        self._updating = False
+        # Model subscriptions; handlers are guarded so syncing one control from
+        # the other never reaches them
+        self._slider_sub = None
+        self._field_sub = None
+        self._slider_end_edit_sub = None
+        self._sync = ModelSync()
+
+        # Models resolved once in build()
+        self._slider_model: Optional[ui.AbstractValueModel] = None
+        self._field_model: Optional[ui.AbstractValueModel] = None
+
+        # Slider drag throttling
+        self._throttle = SliderThrottle(self.SLIDER_NOTIFY_RATE, on_change)
 
     @property
     def value(self) -> float:
@@ -76,19 +96,12 @@ class CameraPropertyWidget:
         Args:
             value: The new value to set.
         """
-        value = max(self._min_val, min(self._max_val, value))
-        value = round(value, self._precision)
+        value = self._clamp_and_round(value)
         self._value = value
-
-        if self._updating:
-            return
-
-        self._updating = True
-        if self._slider:
-            self._slider.model.set_value(value)
-        if self._field:
-            self._field.model.set_value(value)
-        self._updating = False
+        # Drop a throttled drag value so the drag end cannot overwrite this one
+        self._throttle.cancel()
+        self._sync.set_silently(self._slider_model, value)
+        self._sync.set_silently(self._field_model, value)
 
     def build(self) -> ui.HStack:
         """Build the widget UI.
@@ -113,11 +126,19 @@ class CameraPropertyWidget:
             self._field = ui.FloatField(width=self._field_width)
             self._field.model.set_value(self._value)
 
+            self._slider_model = self._slider.model
+            self._field_model = self._field.model
+
             # Connect slider changes
-            self._slider.model.add_value_changed_fn(self._on_slider_changed)
+            self._slider_sub = self._slider_model.subscribe_value_changed_fn(
+                self._sync.guard(self._on_slider_changed)
+            )
+            self._slider_end_edit_sub = self._slider_model.subscribe_end_edit_fn(self._on_slider_end_edit)
 
             # Connect field changes
-            self._field.model.add_value_changed_fn(self._on_field_changed)
+            self._field_sub = self._field_model.subscribe_value_changed_fn(
+                self._sync.guard(self._on_field_changed)
+            )
 
         return container
 
@@ -127,22 +148,22 @@ class CameraPropertyWidget:
         Args:
             model: The slider's value model.
         """
-        if self._updating:
-            return
-
-        self._updating = True
-        value = round(model.as_float, self._precision)
+        value = self._round(model.as_float)
         self._value = value
 
         # Sync to field
-        if self._field:
-            self._field.model.set_value(value)
+        self._sync.set_silently(self._field_model, value)
 
-        # Notify listener
-        if self._on_change:
-            self._on_change(value)
+        # Notify listener, throttled while dragging
+        self._throttle.notify(value)
+
+    def _on_slider_end_edit(self, model):
+        """Send the last throttled slider value when the drag ends.
 
-        self._updating = False
+        Args:
+            model: The slider's value model.
+        """
+        self._throttle.flush()
 
     def _on_field_changed(self, model):
         """Handle field value changes.
@@ -150,23 +171,46 @@ class CameraPropertyWidget:
         Args:
             model: The field's value model.
         """
-        if self._updating:
-            return
-
-        self._updating = True
         value = model.get_value_as_float()
 
         # Clamp to valid range
-        value = max(self._min_val, min(self._max_val, value))
-        value = round(value, self._precision)
+        value = self._clamp_and_round(value)
         self._value = value
+        self._throttle.cancel()
 
         # Sync to slider
-        if self._slider:
-            self._slider.model.set_value(value)
+        self._sync.set_silently(self._slider_model, value)
 
         # Notify listener
         if self._on_change:
             self._on_change(value)
 
-        self._updating = False
+    def _round(self, value: float) -> float:
+        """Round a value to the widget precision, half away from zero.
+
+        Integer scaling is cheaper than round() with ndigits on every slider tick.
+
+        Args:
+            value: The value to round.
+
+        Returns:
+            The rounded value.
+        """
+        scale = self._scale
+        return int(value * scale + (0.5 if value >= 0 else -0.5)) / scale
+
+    def _clamp_and_round(self, value: float) -> float:
+        """Clamp a value to the widget range and round it to the widget precision.
+
+        Args:
+            value: The value to clamp and round.
+
+        Returns:
+            The clamped, rounded value.
+        """
+        min_val, max_val = self._min_val, self._max_val
+        if value < min_val:
+            value = min_val
+        elif value > max_val:
+            value = max_val
+        return self._round(value)
@@ -10,9 +10,12 @@
 
 """Log panel widget for displaying capture log entries."""
 
-from datetime import datetime
-from typing import List, Optional
+import asyncio
+import time
+from collections import deque
+from typing import Deque, List, Optional
 
+import omni.kit.app
 import omni.ui as ui
 
 from ..styles import COLORS
@@ -32,8 +35,13 @@ class LogPanelWidget:
         """
         self._max_entries = max_entries
         self._height = height
-        self._entries: List[str] = []
+        self._entries: Deque[str] = deque(maxlen=max_entries)  # Oldest entry drops on append
         self._label: Optional[ui.Label] = None
+        self._update_scheduled = False  # Label refresh queued for the next frame
+
+        # Entry prefix for the current wall-clock second, reused within that second
+        self._prefix_second = -1
+        self._prefix = ""
 
     @property
     def entries(self) -> List[str]:
@@ -42,7 +50,7 @@ class LogPanelWidget:
         Returns:
             List of log entry strings.
         """
-        return self._entries.copy()
+        return list(self._entries)
 
     @property
     def latest(self) -> Optional[str]:
@@ -59,14 +67,11 @@ class LogPanelWidget:
         Args:
             message: The message to log.
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        entry = f"[{timestamp}] {message}"
-        self._entries.append(entry)
-
-        # Keep only the last N entries
-        if len(self._entries) > self._max_entries:
-            self._entries = self._entries[-self._max_entries:]
-
+        second = int(time.time())
+        if second != self._prefix_second:
+            self._prefix_second = second
+            self._prefix = f"[{time.strftime('%H:%M:%S', time.localtime(second))}] "
+        self._entries.append(self._prefix + message)
         self._update_display()
 
     def clear(self):
@@ -97,7 +102,15 @@ class LogPanelWidget:
         return container
 
     def _update_display(self):
-        """Update the log display with current entries."""
+        """Schedule a log display update, coalescing bursts into one per frame."""
+        if self._label and not self._update_scheduled:
+            self._update_scheduled = True
+            asyncio.ensure_future(self._flush_display_async())
+
+    async def _flush_display_async(self):
+        """Update the log display with current entries on the next frame."""
+        await omni.kit.app.get_app().next_update_async()
+        self._update_scheduled = False
         if self._label:
             self._label.text = self._get_display_text()
 
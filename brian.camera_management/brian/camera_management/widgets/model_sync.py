@@ -0,0 +1,49 @@
+"""Echo-free syncing between the value models of paired controls."""
+
+from typing import Any, Callable
+
+import omni.ui as ui
+
+__all__ = ["ModelSync"]
+
+
+class ModelSync:
+    """Sets value models programmatically without re-entering their handlers.
+
+    Handlers wrapped with guard() return early while set_silently() is updating
+    a model, so syncing one control from the other never echoes back. The
+    subscriptions themselves stay in place.
+    """
+
+    def __init__(self):
+        """Initialize the sync guard."""
+        self._syncing = False
+
+    def guard(self, handler: Callable[[ui.AbstractValueModel], None]) -> Callable[[ui.AbstractValueModel], None]:
+        """Wrap a value-changed handler so it skips programmatic updates.
+
+        Args:
+            handler: The handler to wrap.
+
+        Returns:
+            The wrapped handler, for subscribe_value_changed_fn().
+        """
+        def guarded(model: ui.AbstractValueModel):
+            if not self._syncing:
+                handler(model)
+        return guarded
+
+    def set_silently(self, model: ui.AbstractValueModel, value: Any):
+        """Set a model's value without invoking guarded handlers.
+
+        Args:
+            model: The model to set, or None before the widget is built.
+            value: The value to set.
+        """
+        if model is None:
+            return
+        self._syncing = True
+        try:
+            model.set_value(value)
+        finally:
+            self._syncing = False
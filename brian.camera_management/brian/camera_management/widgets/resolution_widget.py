@@ -15,6 +15,8 @@ from typing import Callable, Optional
 import omni.ui as ui
 
 from ..styles import SPACING
+from .model_sync import ModelSync
+from .slider_throttle import SliderThrottle
 
 __all__ = ["ResolutionWidget"]
 
@@ -24,8 +26,14 @@ class ResolutionWidget:
 
     The slider and field are kept in sync - changing one updates the other.
     This eliminates code duplication for width/height controls.
+
+    While the slider is dragged, on_change is throttled to at most
+    SLIDER_NOTIFY_RATE calls per second; the final value is always sent on release.
     """
 
+    # Maximum on_change calls per second while dragging the slider
+    SLIDER_NOTIFY_RATE = 30.0
+
     def __init__(
         self,
         label: str,
@@ -59,8 +67,19 @@ class ResolutionWidget:
         self._slider: Optional[ui.IntSlider] = None
         self._field: Optional[ui.IntField] = None
 
-        # Prevent recursive updates
-        self._updating = False
+        # Model subscriptions; handlers are guarded so syncing one control from
+        # the other never reaches them
+        self._slider_sub = None
+        self._field_sub = None
+        self._slider_end_edit_sub = None
+        self._sync = ModelSync()
+
+        # Models resolved once in build()
+        self._slider_model: Optional[ui.AbstractValueModel] = None
+        self._field_model: Optional[ui.AbstractValueModel] = None
+
+        # Slider drag throttling
+        self._throttle = SliderThrottle(self.SLIDER_NOTIFY_RATE, on_change)
 
     @property
     def value(self) -> int:
@@ -72,23 +91,17 @@ class ResolutionWidget:
         return self._value
 
     def set_value(self, value: int):
-        """Set the value programmatically.
+        """Set the value programmatically without triggering callback.
 
         Args:
             value: The new value to set.
         """
         value = max(self._min_val, min(self._max_val, value))
         self._value = value
-
-        if self._updating:
-            return
-
-        self._updating = True
-        if self._slider:
-            self._slider.model.set_value(value)
-        if self._field:
-            self._field.model.set_value(value)
-        self._updating = False
+        # Drop a throttled drag value so the drag end cannot overwrite this one
+        self._throttle.cancel()
+        self._sync.set_silently(self._slider_model, value)
+        self._sync.set_silently(self._field_model, value)
 
     def build(self) -> ui.HStack:
         """Build the widget UI.
@@ -105,11 +118,19 @@ class ResolutionWidget:
             self._field = ui.IntField(width=self._field_width)
             self._field.model.set_value(self._value)
 
+            self._slider_model = self._slider.model
+            self._field_model = self._field.model
+
             # Connect slider changes
-            self._slider.model.add_value_changed_fn(self._on_slider_changed)
+            self._slider_sub = self._slider_model.subscribe_value_changed_fn(
+                self._sync.guard(self._on_slider_changed)
+            )
+            self._slider_end_edit_sub = self._slider_model.subscribe_end_edit_fn(self._on_slider_end_edit)
 
             # Connect field changes
-            self._field.model.add_value_changed_fn(self._on_field_changed)
+            self._field_sub = self._field_model.subscribe_value_changed_fn(
+                self._sync.guard(self._on_field_changed)
+            )
 
         return container
 
@@ -119,22 +140,22 @@ class ResolutionWidget:
         Args:
             model: The slider's value model.
         """
-        if self._updating:
-            return
-
-        self._updating = True
         value = model.as_int
         self._value = value
 
         # Sync to field
-        if self._field:
-            self._field.model.set_value(value)
+        self._sync.set_silently(self._field_model, value)
 
-        # Notify listener
-        if self._on_change:
-            self._on_change(value)
+        # Notify listener, throttled while dragging
+        self._throttle.notify(value)
 
-        self._updating = False
+    def _on_slider_end_edit(self, model):
+        """Send the last throttled slider value when the drag ends.
+
+        Args:
+            model: The slider's value model.
+        """
+        self._throttle.flush()
 
     def _on_field_changed(self, model):
         """Handle field value changes.
@@ -142,22 +163,16 @@ class ResolutionWidget:
         Args:
             model: The field's value model.
         """
-        if self._updating:
-            return
-
-        self._updating = True
         value = model.get_value_as_int()
 
         # Clamp to valid range
         value = max(self._min_val, min(self._max_val, value))
         self._value = value
+        self._throttle.cancel()
 
         # Sync to slider
-        if self._slider:
-            self._slider.model.set_value(value)
+        self._sync.set_silently(self._slider_model, value)
 
         # Notify listener
         if self._on_change:
             self._on_change(value)
-
-        self._updating = False
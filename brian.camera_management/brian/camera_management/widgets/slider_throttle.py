@@ -0,0 +1,57 @@
+"""Rate limiting of value callbacks while a slider is dragged."""
+
+import time
+from typing import Any, Callable, Optional
+
+__all__ = ["SliderThrottle"]
+
+
+class SliderThrottle:
+    """Limits how often a slider drag notifies its listener.
+
+    Values arriving faster than the rate are held back; flush() sends the last
+    held value when the drag ends, and cancel() drops it when a newer value was
+    set by other means.
+    """
+
+    def __init__(self, rate: float, on_change: Optional[Callable[[Any], None]]):
+        """Initialize the throttle.
+
+        Args:
+            rate: Maximum on_change calls per second.
+            on_change: Callback to notify. Called with the new value.
+        """
+        self._interval = 1.0 / rate
+        self._on_change = on_change
+        self._last_notify_time = 0.0
+        self._pending_value: Optional[Any] = None
+
+    def notify(self, value: Any):
+        """Send a value now, or hold it back if the last one was sent too recently.
+
+        Args:
+            value: The new value.
+        """
+        if not self._on_change:
+            return
+        now = time.monotonic()
+        if now - self._last_notify_time < self._interval:
+            self._pending_value = value
+        else:
+            self._last_notify_time = now
+            self._pending_value = None
+            self._on_change(value)
+
+    def flush(self):
+        """Send the value held back by notify(), if any."""
+        if self._pending_value is None:
+            return
+        value = self._pending_value
+        self._pending_value = None
+        self._last_notify_time = time.monotonic()
+        if self._on_change:
+            self._on_change(value)
+
+    def cancel(self):
+        """Drop the value held back by notify() without sending it."""
+        self._pending_value = None
@@ -19,6 +19,13 @@ from ..styles import COLORS
 
 __all__ = ["StatusBarWidget"]
 
+# Label style per status, shared so an unchanged status reuses the same object
+_STATUS_STYLES = {
+    CaptureStatus.CAPTURING: {"color": COLORS["status_capturing"]},
+    CaptureStatus.ERROR: {"color": COLORS["status_error"]},
+    CaptureStatus.STOPPED: {"color": COLORS["status_stopped"]},
+}
+
 
 class StatusBarWidget:
     """Widget for displaying capture status with color-coded indicators."""
@@ -47,6 +54,8 @@ class StatusBarWidget:
         Args:
             status: The new status to display.
         """
+        if status == self._status:
+            return
         self._status = status
         self._update_display()
 
@@ -60,7 +69,7 @@ class StatusBarWidget:
             ui.Label("Status:", width=50)
             self._label = ui.Label(
                 self._status.value,
-                style={"color": self._get_status_color()}
+                style=self._get_status_style()
             )
 
         return container
@@ -69,17 +78,12 @@ class StatusBarWidget:
         """Update the label text and color based on current status."""
         if self._label:
             self._label.text = self._status.value
-            self._label.style = {"color": self._get_status_color()}
+            self._label.style = self._get_status_style()
 
-    def _get_status_color(self) -> int:
-        """Get the color for the current status.
+    def _get_status_style(self) -> dict:
+        """Get the label style for the current status.
 
         Returns:
-            The color as an integer ARGB value.
+            The cached style dict with the status color.
         """
-        if self._status == CaptureStatus.CAPTURING:
-            return COLORS["status_capturing"]
-        elif self._status == CaptureStatus.ERROR:
-            return COLORS["status_error"]
-        else:
-            return COLORS["status_stopped"]
+        return _STATUS_STYLES.get(self._status, _STATUS_STYLES[CaptureStatus.STOPPED])
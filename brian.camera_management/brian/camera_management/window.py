@@ -2,14 +2,13 @@
 
 import asyncio
 import os
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Set
 
 import omni.kit.app
 import omni.ui as ui
-from omni.kit.window.filepicker import FilePickerDialog
 
 from .controllers import CaptureController, PreviewController
-from .models import CameraSettings, CaptureStatus, GlobalSettings
+from .models import CameraSettings, CaptureStatus, GlobalSettings, short_name
 from .scene_builder import SceneBuilder
 from .state_manager import StateManager
 from .styles import COLORS, get_window_style
@@ -90,6 +89,7 @@ class CameraManagementWindow(ui.Window):
         self._status_widget: Optional[StatusBarWidget] = None
         self._log_widget: Optional[LogPanelWidget] = None
         self._camera_panel_widgets: List[CameraPanelWidget] = []
+        self._rebuild_scheduled = False  # Panel rebuild queued for the next frame
 
         # Set the build function for deferred UI construction
         self.frame.set_build_fn(self._build_fn)
@@ -237,9 +237,17 @@ class CameraManagementWindow(ui.Window):
                 self._log_widget.build()
 
     def _rebuild_camera_panels(self):
-        """Rebuild all camera panels (deferred to next frame)."""
+        """Rebuild all camera panels (deferred to next frame).
+
+        Repeated calls before the rebuild runs are coalesced into one.
+        """
+        if self._rebuild_scheduled:
+            return
+        self._rebuild_scheduled = True
+
         async def _do_rebuild():
             await omni.kit.app.get_app().next_update_async()
+            self._rebuild_scheduled = False
             if not self._camera_panels_container:
                 return
 
@@ -247,41 +255,96 @@ class CameraManagementWindow(ui.Window):
             self._camera_panels_container.clear()
             self._camera_panel_widgets.clear()
 
-            # Get cameras in use (excluding current selection in each panel)
             all_cameras = self._capture_controller.scan_scene_cameras()
+            selected_paths = self._get_selected_paths()
 
             # Rebuild panels
             with self._camera_panels_container:
-                for i, cam_settings in enumerate(self._camera_list):
-                    # Get cameras in use by OTHER panels
-                    cameras_in_use = {
-                        cam.prim_path for j, cam in enumerate(self._camera_list) if j != i
-                    }
-
-                    callbacks = CameraPanelCallbacks(
-                        on_remove=self._on_remove_camera,
-                        on_preview=self._on_preview_camera,
-                        on_settings_changed=self._on_camera_settings_changed,
-                        on_mode_changed=self._on_capture_mode_changed
+                for i in range(len(self._camera_list)):
+                    self._camera_panel_widgets.append(
+                        self._create_camera_panel(i, all_cameras, selected_paths)
                     )
 
-                    panel = CameraPanelWidget(
-                        index=i,
-                        settings=cam_settings,
-                        all_cameras=all_cameras,
-                        cameras_in_use=cameras_in_use,
-                        is_previewing=self._preview_controller.is_previewing_index(i),
-                        callbacks=callbacks
-                    )
-                    panel.build()
-                    self._camera_panel_widgets.append(panel)
+        asyncio.ensure_future(_do_rebuild())
 
-            # Update capture status for newly built panels
-            is_capturing = self._capture_controller.is_capturing
-            for panel in self._camera_panel_widgets:
-                panel.set_capture_status(is_capturing)
+    def _create_camera_panel(
+        self, index: int, all_cameras: List[str], selected_paths: Set[str]
+    ) -> CameraPanelWidget:
+        """Build the panel for one camera in the current layout context.
 
-        asyncio.ensure_future(_do_rebuild())
+        Args:
+            index: Index of the camera in the camera list.
+            all_cameras: List of all camera prim paths in the scene.
+            selected_paths: Prim paths selected across all panels.
+
+        Returns:
+            The built panel widget.
+        """
+        callbacks = CameraPanelCallbacks(
+            on_remove=self._on_remove_camera,
+            on_preview=self._on_preview_camera,
+            on_settings_changed=self._on_camera_settings_changed,
+            on_mode_changed=self._on_capture_mode_changed
+        )
+
+        panel = CameraPanelWidget(
+            index=index,
+            settings=self._camera_list[index],
+            all_cameras=all_cameras,
+            cameras_in_use=self._get_cameras_in_use(index, selected_paths),
+            is_previewing=self._preview_controller.is_previewing_index(index),
+            callbacks=callbacks
+        )
+        panel.build()
+        panel.set_capture_status(self._capture_controller.is_capturing)
+        return panel
+
+    def _get_selected_paths(self) -> Set[str]:
+        """Get the camera paths selected across all panels.
+
+        Returns:
+            Set of prim paths in the camera list.
+        """
+        return {cam.prim_path for cam in self._camera_list}
+
+    def _get_cameras_in_use(self, index: int, selected_paths: Set[str]) -> Set[str]:
+        """Get the camera paths selected by every panel except one.
+
+        Panels never share a camera (adding picks an unused one and the dropdown
+        rejects cameras in use), so removing the panel's own path is enough.
+
+        Args:
+            index: Index of the panel to exclude.
+            selected_paths: Prim paths selected across all panels.
+
+        Returns:
+            Set of prim paths in use by other panels.
+        """
+        return selected_paths - {self._camera_list[index].prim_path}
+
+    def _refresh_camera_choices(self, all_cameras: List[str]):
+        """Update the camera dropdowns of existing panels after the list changed.
+
+        Args:
+            all_cameras: List of all camera prim paths in the scene.
+        """
+        selected_paths = self._get_selected_paths()
+        for i, panel in enumerate(self._camera_panel_widgets):
+            panel.set_camera_choices(all_cameras, self._get_cameras_in_use(i, selected_paths))
+
+    def _panels_match(self, expected_count: int) -> bool:
+        """Check whether the built panels can be patched instead of rebuilt.
+
+        Args:
+            expected_count: Number of panels expected before the change.
+
+        Returns:
+            True if the panel container exists and holds the expected panels.
+        """
+        return (
+            self._camera_panels_container is not None
+            and len(self._camera_panel_widgets) == expected_count
+        )
 
     # Event handlers
 
@@ -304,10 +367,19 @@ class CameraManagementWindow(ui.Window):
         # Add with first available camera
         new_settings = CameraSettings(
             prim_path=available[0],
-            display_name=available[0].split("/")[-1]
+            display_name=short_name(available[0])
         )
         self._camera_list.append(new_settings)
-        self._rebuild_camera_panels()
+        index = len(self._camera_list) - 1
+        if self._panels_match(index):
+            # Existing panels now show the new camera as in use
+            self._refresh_camera_choices(all_cameras)
+            with self._camera_panels_container:
+                self._camera_panel_widgets.append(
+                    self._create_camera_panel(index, all_cameras, self._get_selected_paths())
+                )
+        else:
+            self._rebuild_camera_panels()
         self._add_log(f"Added camera: {new_settings.display_name}")
         self._save_state()
 
@@ -322,7 +394,13 @@ class CameraManagementWindow(ui.Window):
             self._preview_controller.on_camera_removed(index)
 
             removed = self._camera_list.pop(index)
-            self._rebuild_camera_panels()
+            if self._panels_match(len(self._camera_list) + 1):
+                self._camera_panel_widgets.pop(index).destroy()
+                for i in range(index, len(self._camera_panel_widgets)):
+                    self._camera_panel_widgets[i].set_index(i)
+                self._refresh_camera_choices(self._capture_controller.scan_scene_cameras())
+            else:
+                self._rebuild_camera_panels()
             self._add_log(f"Removed camera: {removed.display_name}")
             self._save_state()
 
@@ -385,7 +463,8 @@ class CameraManagementWindow(ui.Window):
         Args:
             preview_index: Index of camera being previewed, or None.
         """
-        self._rebuild_camera_panels()
+        for i, panel in enumerate(self._camera_panel_widgets):
+            panel.set_previewing(i == preview_index)
 
     def _on_camera_settings_changed(self, index: int, settings: CameraSettings):
         """Handle camera settings changes.
@@ -445,6 +524,9 @@ class CameraManagementWindow(ui.Window):
 
     def _on_change_folder(self):
         """Handle Change Folder button click."""
+        # Imported on first use so loading the window does not pull in the file picker
+        from omni.kit.window.filepicker import FilePickerDialog
+
         def on_folder_selected(filename: str, dirname: str):
             self._global_settings.output_folder = dirname
             if self._output_folder_field: